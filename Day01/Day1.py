@@ -3,13 +3,30 @@
     Who: Josh Geiser
 '''
 
+import re
 from pathlib import Path
 
+import sys
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc import loader
+from aoc.lazy import lazy_import
+from aoc.registry import engine
+
+np = lazy_import('numpy')
+
+# Digits and spelled-out digits, for the part 2 regex engine
+DIGIT_WORDS = ['zero', 'one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine']
+DIGIT_VALUES = {**{w.encode(): v for v, w in enumerate(DIGIT_WORDS)}, **{str(v).encode(): v for v in range(10)}}
+DIGIT_PATTERN = b'|'.join([rb'\d'] + [w.encode() for w in DIGIT_WORDS])
+
+# First and last digit on a line, both looked for from the start of the line so
+# they can overlap - the greedy .* backs off to the latest digit that starts on
+# the line, so "oneight" ends in 8 (and "7" starts and ends in 7)
+CALIBRATION_RE = re.compile(rb'^(?=.*?(' + DIGIT_PATTERN + rb'))(?=.*(' + DIGIT_PATTERN + rb'))', re.M)
+
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def read_input(infile):
-    with open(infile, 'r') as f:
-        x = f.readlines()
-    return x
+    return loader.read_lines(infile)
 
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def task_1(inputs):
@@ -21,6 +38,31 @@ def task_1(inputs):
 
     return sum
 
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+@engine(1, 'numpy', read_input=loader.read_bytes)
+def task_1_numpy(buf):
+    '''
+    Part 1 over the raw bytes of the whole file - mask the digits, work out which
+    line each one is on from the newline positions, and pick out the first and
+    last digit of every line without looping over the lines in Python
+    '''
+
+    data = np.frombuffer(buf, dtype=np.uint8)
+    digits = np.flatnonzero((data >= ord('0')) & (data <= ord('9')))
+    if len(digits) == 0:
+        return 0
+    lines = np.searchsorted(np.flatnonzero(data == ord('\n')), digits)
+
+    # A digit is the first on its line if the digit before it is on an earlier
+    # line, and the last if the digit after it is on a later one
+    firsts = np.flatnonzero(np.diff(lines, prepend=-1))
+    lasts = np.append(firsts[1:], len(digits)) - 1
+
+    values = data[digits].astype(np.int64) - ord('0')
+    sum = 10*values[firsts].sum() + values[lasts].sum()
+
+    return int(sum)
+
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def task_2(inputs):
 
@@ -62,6 +104,21 @@ def task_2(inputs):
 
     return sum
 
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+@engine(2, 'regex', read_input=loader.read_bytes)
+def task_2_regex(buf):
+    '''
+    Part 2 in one regex pass over the whole file rather than trying every
+    mapping key at every position - the regex engine finds each line's first
+    and last digit (word) itself, overlaps included
+    '''
+
+    sum = 0
+    for first, last in CALIBRATION_RE.findall(buf):
+        sum += DIGIT_VALUES[first]*10 + DIGIT_VALUES[last]
+
+    return sum
+
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def main():
 
@@ -3,14 +3,28 @@
     Who: Josh Geiser
 '''
 
+import math
+import re
 from pathlib import Path
 
+import sys
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc import loader, parallel
+from aoc.lazy import lazy_import
+from aoc.registry import engine
+
+np = lazy_import('numpy')
+
+# Cube colors, in the order of the Games count columns
+COLORS = ('red', 'green', 'blue')
+CUBES_RE = re.compile(r'(\d+) (red|green|blue)')
+
+# Biggest lookup table GameIndex will build (one int64 per cell)
+MAX_TABLE_CELLS = 1 << 22
+
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def read_input(infile):
-
-    with open(infile, 'r') as f:
-        x = f.readlines()
-    return x
+    return loader.read_lines(infile)
 
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def task_1(inputs):
@@ -63,6 +77,158 @@ def task_2(inputs):
 
     return sum
 
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+class Games():
+    '''
+    Every draw of every game, parsed once into columns: "ids" holds each game's
+    id, and for every draw "game" holds the index of the game it belongs to,
+    "draw" its index within that game and "cubes" its red/green/blue counts
+    (0 for a color it didn't show). Draws are stored game by game, so the
+    per-game questions are grouped reductions over the columns.
+    '''
+
+    def __init__(self, ids, game, draw, cubes):
+        self.ids = ids
+        self.game = game
+        self.draw = draw
+        self.cubes = cubes
+        self.__maxima = None
+
+    @classmethod
+    def from_lines(cls, lines):
+        ids, game, draw, cubes = [], [], [], []
+        for input in lines:
+            head, _, sets = input.partition(':')
+            for j, set in enumerate(sets.split(';')):
+                counts = {col: int(num) for num, col in CUBES_RE.findall(set)}
+                game.append(len(ids))
+                draw.append(j)
+                cubes.append([counts.get(col, 0) for col in COLORS])
+            ids.append(int(head.rpartition(' ')[2]))
+
+        return cls(np.array(ids, dtype=np.int64), np.array(game, dtype=np.int64),
+                   np.array(draw, dtype=np.int64), np.array(cubes, dtype=np.int64).reshape(-1, len(COLORS)))
+
+    def maxima(self):
+        '''
+        Most cubes of each color shown in any one draw, per game - a (games, 3)
+        array, worked out once
+        '''
+        if self.__maxima is None:
+            if len(self.ids) == 0:
+                self.__maxima = np.zeros((0, len(COLORS)), dtype=np.int64)
+            else:
+                starts = np.flatnonzero(np.diff(self.game, prepend=-1))
+                self.__maxima = np.maximum.reduceat(self.cubes, starts, axis=0)
+        return self.__maxima
+
+    def possible(self, limits):
+        '''
+        Which games could have been played with at most "limits" cubes of each
+        color (a dict like {'red': 12, 'green': 13, 'blue': 14}), as a mask
+        '''
+        return (self.maxima() <= [limits[col] for col in COLORS]).all(axis=1)
+
+    def id_sum(self, limits):
+        return int(self.ids[self.possible(limits)].sum())
+
+    def powers(self):
+        '''
+        Power of each game's smallest possible set of cubes
+        '''
+        return self.maxima().prod(axis=1)
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+class GameIndex():
+    '''
+    Long-lived index for asking "which games are possible under these limits"
+    over and over. A game is possible exactly when each of its per-color maxima
+    is within the limits, so the sum of the possible ids is a 3-d prefix sum over
+    (red, green, blue) maxima. With the usual handfuls of cubes that table is
+    small, and every query is a single lookup. If the counts get too big for the
+    table, games are kept sorted by their red maximum instead, so a query only
+    has to check the games a binary search leaves under the red limit.
+    '''
+
+    def __init__(self, games):
+        self.ids = games.ids
+        self.maxima = games.maxima()
+        self.top = self.maxima.max(axis=0) if len(self.ids) else np.zeros(len(COLORS), dtype=np.int64)
+
+        self.table = None
+        if math.prod(int(x) + 1 for x in self.top) <= MAX_TABLE_CELLS:
+            self.table = np.zeros(tuple(self.top + 1), dtype=np.int64)
+            np.add.at(self.table, tuple(self.maxima.T), self.ids)
+            for axis in range(len(COLORS)):
+                np.cumsum(self.table, axis=axis, out=self.table)
+        else:
+            order = np.argsort(self.maxima[:, 0], kind='stable')
+            self.sorted_maxima = self.maxima[order]
+            self.sorted_ids = self.ids[order]
+
+    def id_sum(self, limits):
+        '''
+        Sum of the ids of the games possible under "limits" (a dict like
+        {'red': 12, 'green': 13, 'blue': 14})
+        '''
+        return int(self.id_sums([[limits[col] for col in COLORS]])[0])
+
+    def id_sums(self, limits):
+        '''
+        Sum of the possible game ids for each row of a (queries, 3) array of
+        red/green/blue limits, all at once
+        '''
+
+        limits = np.asarray(limits, dtype=np.int64).reshape(-1, len(COLORS))
+        if self.table is not None:
+            sums = self.table[tuple(np.clip(limits, 0, self.top).T)]
+            sums[(limits < 0).any(axis=1)] = 0
+            return sums
+
+        sums = np.zeros(len(limits), dtype=np.int64)
+        ends = np.searchsorted(self.sorted_maxima[:, 0], limits[:, 0], side='right')
+        for i, (end, limit) in enumerate(zip(ends, limits)):
+            fits = (self.sorted_maxima[:end, 1:] <= limit[1:]).all(axis=1)
+            sums[i] = self.sorted_ids[:end][fits].sum()
+
+        return sums
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+@engine(1, 'numpy')
+def task_1_numpy(inputs):
+    '''
+    Part 1 from the columnar table - a game is possible if none of its per-color
+    maxima is over the limit
+    '''
+    return Games.from_lines(inputs).id_sum({'red': 12, 'green': 13, 'blue': 14})
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+@engine(2, 'numpy')
+def task_2_numpy(inputs):
+    '''
+    Part 2 from the columnar table - the smallest set for a game is just its
+    per-color maxima
+    '''
+    return int(Games.from_lines(inputs).powers().sum())
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+@engine(1, 'parallel')
+def task_1_parallel(inputs, workers=None):
+    '''
+    Part 1 split across worker processes - every game is checked on its own, so
+    each chunk of games is just a smaller task_1
+    '''
+    return parallel.chunked_sum(task_1, inputs, workers)
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+@engine(2, 'parallel')
+def task_2_parallel(inputs, workers=None):
+    '''
+    Part 2 split across worker processes - every game is powered up on its own,
+    so each chunk of games is just a smaller task_2
+    '''
+    return parallel.chunked_sum(task_2, inputs, workers)
+
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def main():
 
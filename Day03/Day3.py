@@ -5,12 +5,18 @@
 
 from pathlib import Path
 
+import sys
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc import loader
+from aoc.grid import Grid
+from aoc.lazy import lazy_import
+from aoc.registry import engine
+
+np = lazy_import('numpy')
+
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def read_input(infile):
-
-    with open(infile, 'r') as f:
-        x = f.readlines()
-    return x
+    return loader.read_lines(infile)
 
 def __isValidNum(inputs, num):
     '''
@@ -143,6 +149,137 @@ def task_2(inputs):
 
     return out
 
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+class Schematic():
+    '''
+    The engine schematic labeled in one pass. Every run of digits (a number) gets
+    an id from 1 up, and "labels" is an (m, n) grid holding each cell's number id
+    (0 where there's no number). "values" maps ids to their numbers, with
+    values[0] = 0 so indexing it with "labels" works everywhere.
+    '''
+
+    def __init__(self, lines):
+        self.grid = Grid.from_lines(lines)
+        self.digits = self.grid.mask('0123456789')
+        self.symbols = ~self.digits & ~self.grid.mask('.')
+
+        # A number starts wherever a digit doesn't have another digit to its left
+        starts = self.digits & ~self.grid.shift(self.digits, 0, +1)
+        self.labels = np.where(self.digits, np.cumsum(starts).reshape(self.grid.shape), 0)
+        self.count = int(starts.sum())
+        self.__adjacency = None
+
+        # Each digit is worth 10^(digits to the right of it in the same number)
+        cells = np.flatnonzero(self.digits)
+        ids = self.labels.ravel()[cells]
+        ends = np.flatnonzero(np.diff(ids, append=self.count + 1))
+        place = ends[ids - 1] - np.arange(len(cells))
+        self.values = np.zeros(self.count + 1, dtype=np.int64)
+        np.add.at(self.values, ids, (self.grid.data.ravel()[cells] - ord('0')).astype(np.int64) * 10**place)
+
+    def part_numbers(self):
+        '''
+        Ids of the numbers next to a symbol. Like task_1, a digit in the row above
+        or below counts as well (anything but a '.' does).
+        '''
+
+        near = self.grid.dilate(self.symbols)
+        for di in (-1, +1):
+            for dj in (-1, 0, +1):
+                near |= self.grid.shift(self.digits, di, dj)
+
+        ids = np.unique(self.labels[near & self.digits])
+        return ids[ids > 0]
+
+    def neighbor_ids(self, cells):
+        '''
+        The number ids around each of some (row, col) cells, as a (cells, 8)
+        array with 0 where a neighbor isn't part of a number (or is off the grid)
+        '''
+        padded = np.pad(self.labels, 1)
+        rows, cols = cells[:, 0] + 1, cells[:, 1] + 1
+        steps = [(di, dj) for di in (-1, 0, 1) for dj in (-1, 0, 1) if (di, dj) != (0, 0)]
+        return np.stack([padded[rows + di, cols + dj] for di, dj in steps], axis=1)
+
+    def adjacency(self):
+        '''
+        Index of which numbers are next to which symbols, built once (see
+        SymbolIndex)
+        '''
+        if self.__adjacency is None:
+            self.__adjacency = SymbolIndex(self)
+        return self.__adjacency
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+class SymbolIndex():
+    '''
+    Symbol to adjacent number index for a Schematic, in CSR form: symbol s sits
+    at cells[s] and is the character chars[s], and the ids of the distinct
+    numbers around it are indices[indptr[s]:indptr[s+1]]. Any rule about which
+    symbols count and what to do with their numbers can then be answered from
+    these arrays, without going back to the schematic.
+    '''
+
+    def __init__(self, schematic):
+        self.values = schematic.values
+        self.cells = np.argwhere(schematic.symbols)
+        self.chars = schematic.grid.data[schematic.symbols]
+
+        # Sort each symbol's neighbor ids so repeats (one number touching the
+        # symbol in several cells) sit together, then keep the first of each
+        ids = np.sort(schematic.neighbor_ids(self.cells), axis=1)
+        new = np.concatenate([ids[:, :1] != 0, (ids[:, 1:] != ids[:, :-1]) & (ids[:, 1:] != 0)], axis=1)
+
+        self.degree = new.sum(axis=1)
+        self.indptr = np.concatenate([[0], np.cumsum(self.degree)])
+        self.indices = ids[new]
+
+    def select(self, symbol=None, k=None):
+        '''
+        Which symbols are the character "symbol" and have exactly "k" numbers
+        around them (either left as None matches anything)
+        '''
+        keep = np.ones(len(self.cells), dtype=bool)
+        if symbol is not None:
+            keep &= self.chars == ord(symbol)
+        if k is not None:
+            keep &= self.degree == k
+        return np.flatnonzero(keep)
+
+    def numbers(self, s):
+        '''
+        The numbers around symbol s
+        '''
+        return self.values[self.indices[self.indptr[s]:self.indptr[s+1]]]
+
+    def products(self, symbol='*', k=2):
+        '''
+        For every "symbol" with exactly k numbers around it, the product of those
+        numbers - part 2's gear ratios with the defaults
+        '''
+        rows = self.select(symbol, k)
+        positions = self.indptr[rows][:, None] + np.arange(k)
+        return self.values[self.indices[positions]].prod(axis=1)
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+@engine(1, 'numpy')
+def task_1_numpy(inputs):
+    '''
+    Part 1 from the labeled grid - sum the numbers with a label under the dilated
+    symbol mask
+    '''
+    schematic = Schematic(inputs)
+    return int(schematic.values[schematic.part_numbers()].sum())
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+@engine(2, 'numpy')
+def task_2_numpy(inputs):
+    '''
+    Part 2 from the labeled grid - index the numbers around every symbol, then
+    multiply them out for each '*' with exactly two
+    '''
+    return int(Schematic(inputs).adjacency().products('*', 2).sum())
+
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def main():
 
@@ -3,14 +3,17 @@
     Who: Josh Geiser
 '''
 
+from array import array
 from pathlib import Path
 
+import sys
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc import loader
+from aoc.registry import engine
+
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def read_input(infile):
-
-    with open(infile, 'r') as f:
-        x = f.readlines()
-    return x
+    return loader.read_lines(infile)
 
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def task_1(inputs):
@@ -31,29 +34,164 @@ def task_1(inputs):
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def task_2(inputs):
 
-    # Helper variables
-    inputs = [input.strip() for input in inputs]
-    numCopies = {i:1 for i in list(range(1, len(inputs)+1))}
+    # Extra copies already won of the cards coming up (we never need more than a
+    # handful of cards ahead, so this works one line at a time). For each of them
+    # also keep the copies won the first time, since a card past the end of the
+    # table counts as 1 in place of that first win.
+    pending = {}
+    firstWon = {}
 
-    card = 1
+    sum_out = 0
+    card = 0
     for input in inputs:
+        card += 1
 
         # Get number of matches
+        input = input.strip()
         left, right = input[input.index(':')+2:].split('|')
         left = [x for x in left.strip().split(' ') if len(x)>0]
         right = [x for x in right.strip().split(' ') if len(x)>0]
         numMatches = len([r for r in right if r in left])
 
+        # The original plus whatever we've won of this card so far
+        numCopies = 1 + pending.pop(card, 0)
+        firstWon.pop(card, None)
+        sum_out += numCopies
+
         # Now figure out number of copies of below cards
         for cardToAdd in range(card+1, card+1+numMatches):
-            if cardToAdd not in numCopies:
-                numCopies[cardToAdd] = 1
-            else:
-                numCopies[cardToAdd] += numCopies[card]
+            if cardToAdd not in pending:
+                pending[cardToAdd] = 0
+                firstWon[cardToAdd] = numCopies
+            pending[cardToAdd] += numCopies
 
-        card += 1
+    # Anything left over was won past the end of the table
+    for cardToAdd, copies in pending.items():
+        sum_out += 1 + copies - firstWon[cardToAdd]
+
+    return sum_out
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+class Cards():
+    '''
+    Every scratchcard parsed once. The winning numbers of all the cards sit back
+    to back in "winning" and the numbers we hold in "held" (both array('H'), so
+    numbers up to 65535), with card c's numbers at winning[winStarts[c]:winStarts[c+1]]
+    and held[heldStarts[c]:heldStarts[c+1]]. "matches" is each card's number
+    of matches (counted the first time it's asked for), which is all either
+    part, or any other way of scoring the cards, needs.
+    '''
+
+    def __init__(self, lines):
+        self.winning = array('H')
+        self.held = array('H')
+        self.winStarts = array('L', [0])
+        self.heldStarts = array('L', [0])
+        for input in lines:
+            left, right = input[input.index(':')+1:].split('|')
+            self.winning.extend(int(x) for x in left.split())
+            self.held.extend(int(x) for x in right.split())
+            self.winStarts.append(len(self.winning))
+            self.heldStarts.append(len(self.held))
+        self._matches = None
+
+    def __len__(self):
+        return len(self.winStarts) - 1
+
+    def numbers(self, c):
+        '''
+        (winning, held) numbers of card c (counting from 0)
+        '''
+        return (self.winning[self.winStarts[c]:self.winStarts[c+1]],
+                self.held[self.heldStarts[c]:self.heldStarts[c+1]])
+
+    @staticmethod
+    def bitmask(numbers):
+        '''
+        A set of numbers as the bits of an int
+        '''
+        mask = 0
+        for x in numbers:
+            mask |= 1 << x
+        return mask
+
+    @property
+    def matches(self):
+        '''
+        Number of matches on each card, as an array('H'), worked out once - the
+        popcount of the card's winning and held numbers ANDed together. Numbers
+        are never repeated on one side of a card, so this agrees with counting
+        them off.
+        '''
+        if self._matches is None:
+            self._matches = array('H')
+            for c in range(len(self)):
+                winning, held = self.numbers(c)
+                self._matches.append((self.bitmask(winning) & self.bitmask(held)).bit_count())
+        return self._matches
 
-    return sum(list(numCopies.values()))
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def read_cards(infile):
+    '''
+    Input reader for the bitmask engines - parse the cards once (the engines
+    count the matches)
+    '''
+    return Cards(loader.read_lines(infile))
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def __total_cards(matches):
+    '''
+    Helper function for part 2's bitmask engine - total cards we end up with,
+    given each card's number of matches. A card with numCopies copies and
+    numMatches matches adds numCopies to a whole range of cards, so rather than
+    adding to each of them, mark where the range starts and stops in a
+    difference array and keep a running sum as we go - O(1) per card.
+    '''
+
+    numCards = len(matches)
+    diff = [0] * (numCards + max(matches, default=0) + 2)
+
+    # Same as task_2, cards won past the end of the table count as 1 in place
+    # of the copies won the first time (firstWon)
+    firstWon = {}
+    reach = numCards
+
+    sum_out = 0
+    running = 0
+    for card in range(1, len(diff)):
+        running += diff[card]
+        if card <= numCards:
+            numCopies = 1 + running
+        elif card <= reach:
+            numCopies = 1 + running - firstWon[card]
+        else:
+            break
+        sum_out += numCopies
+
+        if card <= numCards and matches[card-1] > 0:
+            diff[card+1] += numCopies
+            diff[card+1+matches[card-1]] -= numCopies
+            for cardToAdd in range(reach+1, card+1+matches[card-1]):
+                firstWon[cardToAdd] = numCopies
+            reach = max(reach, card+matches[card-1])
+
+    return sum_out
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+@engine(1, 'bitmask', read_input=read_cards)
+def task_1_bitmask(cards):
+    '''
+    Part 1 from the parsed cards (bitmask matching, see Cards.matches)
+    '''
+    return sum(2 ** (numMatches-1) for numMatches in cards.matches if numMatches > 0)
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+@engine(2, 'bitmask', read_input=read_cards)
+def task_2_bitmask(cards):
+    '''
+    Part 2 from the parsed cards, with a difference array for the copies
+    '''
+    return __total_cards(cards.matches)
 
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def main():
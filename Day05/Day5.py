@@ -3,14 +3,85 @@
     Who: Josh Geiser
 '''
 
+from bisect import bisect_right
+from collections import namedtuple
 from pathlib import Path
 
+import sys
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc import loader
+from aoc.lazy import lazy_import
+from aoc.parsing import int_array, int_matrix, ints
+from aoc.registry import engine
+
+np = lazy_import('numpy')
+
+# Biggest number an int64 holds - also where the composed seed-to-location map
+# stops
+DOMAIN_END = 2**63 - 1
+
+# The parsed almanac - the seed line's numbers as an array, and a tuple with one
+# (mappings, 3) array per map layer, each row a (source start, destination
+# start, length) mapping and the rows sorted by source start. The arrays are
+# int64 when every number (and every range end) fits, and otherwise object
+# arrays of plain Python ints, so nothing overflows (parse_almanac is the one
+# place that's decided). Either way they're
+# read-only, so every task can share one almanac.
+Almanac = namedtuple('Almanac', ['seeds', 'layers'])
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def __read_only(arr):
+    '''
+    Helper function for parse_almanac - lock an array against changes
+    '''
+    arr.flags.writeable = False
+    return arr
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def __ends_fit(seeds, layers):
+    '''
+    Helper function for parse_almanac - whether every seed range and every
+    mapping ends within an int64 (the engines add starts and lengths up)
+    '''
+    pairs = seeds[:len(seeds) // 2 * 2].reshape(-1, 2)
+    if (pairs[:, 1] > DOMAIN_END - pairs[:, 0]).any():
+        return False
+    return not any((np.maximum(layer[:, 0], layer[:, 1]) > DOMAIN_END - layer[:, 2]).any() for layer in layers)
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def parse_almanac(inputs):
+    '''
+    Parse the almanac's lines in one pass (see Almanac)
+    '''
+
+    # Each map's lines, between its "... map:" header and the next blank line
+    blocks = []
+    for input in inputs[1:]:
+        if 'map' in input:
+            blocks.append([])
+        elif len(input) > 0:
+            blocks[-1].append(input)
+
+    # int64 arrays straight from the text, with each map's columns reordered to
+    # (source, destination, length). int_array() raises OverflowError for a
+    # number past the int64 limit, and so do we for a range ending past it -
+    # either way we keep plain Python ints instead.
+    try:
+        seeds = int_array(inputs[0])
+        layers = [int_matrix(block).reshape(-1, 3)[:, [1, 0, 2]] for block in blocks]
+        if not __ends_fit(seeds, layers):
+            raise OverflowError
+        layers = [layer[np.lexsort(layer.T[::-1])] for layer in layers]
+    except OverflowError:
+        seeds = np.array(ints(inputs[0]), dtype=object)
+        layers = [np.array(sorted((src, dst, length) for dst, src, length in map(ints, block)), dtype=object).reshape(-1, 3)
+                  for block in blocks]
+
+    return Almanac(__read_only(seeds), tuple(__read_only(layer) for layer in layers))
+
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def read_input(infile):
-    with open(infile, 'r') as f:
-        data = f.readlines()
-    data = [x.strip() for x in data]
-    return data
+    return parse_almanac(loader.read_lines(infile))
 
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def __get_val(seed, mappings):
@@ -18,38 +89,19 @@ def __get_val(seed, mappings):
     Helper function for task 1 - map a seed value to it's next value given mapping
     '''
     for mapping in mappings:
-        if (mapping[1] <= seed < mapping[1]+mapping[2]):
-            return mapping[0] + (seed - mapping[1])
+        if (mapping[0] <= seed < mapping[0]+mapping[2]):
+            return mapping[1] + (seed - mapping[0])
         
     return seed
 
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-def task_1(inputs):
+def task_1(almanac):
 
-    # Get the seeds and then skip to the first map
-    seeds = [int(x) for x in inputs[0].split(': ')[1].split(' ')]
-    inputs.append('')
-
-    # Iterate through our file 'til we're done!
-    i = 2
-    while (i < len(inputs)):
-        assert 'map' in inputs[i]
-
-        # mapping = {}
-        mappings = []
-
-        # Increment lines of our input file until we've reached a blank line, meaning new "layer"
-        i+=1
-        while len(inputs[i]) > 0:
-            line = inputs[i]
-
-            # Add this row to our mapping dictionary
-            mappings.append([int(x) for x in line.split(' ')])
-            i+=1
-
-        # Now map our seeds through the next "layer"
+    # Map our seeds through each "layer" in turn
+    seeds = almanac.seeds.tolist()
+    for layer in almanac.layers:
+        mappings = layer.tolist()
         seeds = [__get_val(seed, mappings) for seed in seeds]
-        i+=1
 
     return min(seeds)
 
@@ -63,15 +115,15 @@ def __get_val2(seed, mappings):
 
     # If our current value is within one of the mapping ranges, return as soon as that's found
     for mapping in mappings:
-        if (mapping[1] <= seed < mapping[1]+mapping[2]):
-            return mapping[0] + (seed - mapping[1]), abs(mapping[2] - ((seed - mapping[1])))
+        if (mapping[0] <= seed < mapping[0]+mapping[2]):
+            return mapping[1] + (seed - mapping[0]), abs(mapping[2] - ((seed - mapping[0])))
         
 
     # If we've gotten this far, our return value is just our input value. However
     # we also need to calculate the "buffer" to the nearest mapping range.
     min_dist = 1e20
     for mapping in mappings:
-        compare = mapping[1]
+        compare = mapping[0]
         if (compare - seed) > 0 and (compare - seed) < min_dist:
             min_dist = compare - seed
 
@@ -91,39 +143,7 @@ def __f(seed, total_map):
     return seed, min(buffers)
 
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-def __get_map(inputs):
-    '''
-    Helper function for task 2 for getting our mappings between locations
-    '''
-
-    total_map = []
-    mappings = []
-
-    # Iterate through our file 'til we're done!
-    i = 2
-    while (i < len(inputs)):
-        assert 'map' in inputs[i]
-
-        # mapping = {}
-        mappings = []
-
-        # Increment lines of our input file until we've reached a blank line, meaning new "layer"
-        i+=1
-        while len(inputs[i]) > 0:
-            line = inputs[i]
-
-            # Add this row to our mapping dictionary
-            mappings.append([int(x) for x in line.split(' ')])
-            i+=1
-
-        # Now map our seeds through the next "layer"
-        total_map.append(mappings)
-        i+=1
-    
-    return total_map
-
-#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-def task_2(inputs):
+def task_2(almanac):
     '''
     General idea is that we can't (quickly) brute force looking through all the
     ranges of seed values. However, since we know that output locations will be 
@@ -132,11 +152,10 @@ def task_2(inputs):
     '''
 
     # Get our total_map that'll be used to calculate location = f(seed) for each seed
-    inputs.append('')
-    total_map = __get_map(inputs)
+    total_map = [layer.tolist() for layer in almanac.layers]
 
     # Let's just make a 2d array of our starting/ending seed ranges to look through
-    first_line = [int(x) for x in inputs[0].split(': ')[1].split(' ')]
+    first_line = almanac.seeds.tolist()
     seed_ranges = [[first_line[i], first_line[i]+first_line[i+1]-1] for i in range(0, len(first_line), 2)]
 
     # Now iterate through each of the individual seed ranges
@@ -158,18 +177,137 @@ def task_2(inputs):
     # Finally, return the minimum of all of our output locations
     return min(visited_outs)
 
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def __split_range(lo, hi, layer, starts):
+    '''
+    Helper function for the interval and piecewise engines - cut the half-open
+    range [lo, hi) wherever one of a layer's mappings starts or stops, yielding
+    (lo, hi, shift) pieces where "shift" is what the layer adds to that piece (0
+    in between mappings). "starts" are the mappings' source starts, so a binary
+    search can find the first mapping the range touches and the range only ever
+    looks at the mappings it actually overlaps.
+    '''
+
+    k = max(bisect_right(starts, lo) - 1, 0)
+    while lo < hi:
+
+        # Past the last mapping, everything passes through
+        if k == len(layer):
+            yield lo, hi, 0
+            return
+
+        src, dst, length = layer[k]
+        if lo >= src + length:
+            k += 1
+        elif lo < src:
+            cut = min(hi, src)
+            yield lo, cut, 0
+            lo = cut
+        else:
+            cut = min(hi, src + length)
+            yield lo, cut, dst - src
+            lo = cut
+            k += 1
+
+    return
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def __map_ranges(ranges, layer):
+    '''
+    Helper function for the interval engine - push half-open [lo, hi) ranges
+    through one layer. Pieces inside a mapping get shifted and pieces in between
+    pass through as they are.
+    '''
+    starts = [src for src, _, _ in layer]
+    return [(lo + shift, hi + shift) for a, b in ranges for lo, hi, shift in __split_range(a, b, layer, starts)]
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def __merge_ranges(ranges):
+    '''
+    Helper function for the interval engine - sort ranges and merge the ones
+    that overlap or touch, so the number of ranges doesn't keep growing
+    '''
+    merged = []
+    for lo, hi in sorted(ranges):
+        if merged and lo <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], hi))
+        else:
+            merged.append((lo, hi))
+    return merged
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+@engine(2, 'intervals')
+def task_2_intervals(almanac):
+    '''
+    Part 2 with whole seed ranges pushed through every layer at once, rather than
+    stepping through seeds. Plain Python ints throughout (tolist() hands them
+    back from int64 arrays too), so it's exact for any size of number, and the
+    answer is just the lowest range start at the end.
+    '''
+
+    seeds = almanac.seeds.tolist()
+    ranges = [(seeds[i], seeds[i] + seeds[i+1]) for i in range(0, len(seeds), 2)]
+    for layer in almanac.layers:
+        ranges = __merge_ranges(__map_ranges(ranges, layer.tolist()))
+
+    return ranges[0][0]
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def __compose(layers):
+    '''
+    Helper function for the piecewise engine - compose every layer into a single
+    seed-to-location map. The map is piecewise linear with slope 1, so it's just
+    sorted breakpoints plus the offset to add from each breakpoint on: location
+    = seed + offsets[k] for the last k with breaks[k] <= seed. Start from the
+    identity and push each piece's image through the next layer, cutting the
+    piece wherever the layer cuts its image.
+    '''
+
+    pieces = [(0, DOMAIN_END, 0)]
+    for layer in layers:
+        layer = layer.tolist()
+        starts = [src for src, _, _ in layer]
+        pieces = [(lo - offset, hi - offset, offset + shift)
+                  for a, b, offset in pieces for lo, hi, shift in __split_range(a + offset, b + offset, layer, starts)]
+
+    # Neighboring pieces that ended up with the same offset are really one piece
+    breaks, offsets = [], []
+    for lo, _, offset in pieces:
+        if not offsets or offset != offsets[-1]:
+            breaks.append(lo)
+            offsets.append(offset)
+
+    return np.array(breaks, dtype=np.int64), np.array(offsets, dtype=np.int64)
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+@engine(1, 'piecewise')
+def task_1_piecewise(almanac):
+    '''
+    Part 1 through the composed map - one binary search per seed, all seeds in
+    one vectorized batch. Needs an int64 almanac (see parse_almanac).
+    '''
+
+    if almanac.seeds.dtype != np.int64:
+        raise OverflowError('the piecewise engine needs every number to fit in an int64')
+
+    breaks, offsets = __compose(almanac.layers)
+    seeds = almanac.seeds
+    locations = seeds + offsets[np.searchsorted(breaks, seeds, side='right') - 1]
+
+    return int(locations.min())
+
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def main():
 
     here = Path(__file__).parent
     infile = here / 'input.txt'
 
-    inputs = read_input(infile)
-    answer_1 = task_1(inputs)
+    # One read and one parse for both parts
+    almanac = read_input(infile)
+    answer_1 = task_1(almanac)
     print(answer_1)
 
-    inputs = read_input(infile)
-    answer_2 = task_2(inputs)
+    answer_2 = task_2(almanac)
     print(answer_2)
 
     return
@@ -4,19 +4,29 @@
 '''
 
 from pathlib import Path
-from math import floor
+from math import floor, isqrt, prod
+
+import sys
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc import loader
+from aoc.lazy import lazy_import
+from aoc.registry import engine
+
+np = lazy_import('numpy')
+
+# Biggest race time ways_to_win_many() does in int64 - below this, time^2 (and
+# so every product it works out) fits
+MAX_BATCH_TIME = 2**31
 
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def read_input(infile):
-    with open(infile, 'r') as f:
-        data = f.readlines()
-    data = [x.strip() for x in data]
-    return data
+    return loader.read_lines(infile)
 
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def __parse_input(inputs):
-    times = [int(x) for x in inputs[0].split(':')[1].split(' ') if len(x) > 0]
-    distances = [int(x) for x in inputs[1].split(':')[1].split(' ') if len(x) > 0]
+    lines = iter(inputs)
+    times = [int(x) for x in next(lines).split(':')[1].split(' ') if len(x) > 0]
+    distances = [int(x) for x in next(lines).split(':')[1].split(' ') if len(x) > 0]
     return times, distances
 
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
@@ -49,8 +59,9 @@ def task_1(inputs):
 
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def __parse_input_2(inputs):
-    time = int(inputs[0].split(':')[1].strip().replace(' ', ''))
-    distance = int(inputs[1].split(':')[1].strip().replace(' ', ''))
+    lines = iter(inputs)
+    time = int(next(lines).split(':')[1].strip().replace(' ', ''))
+    distance = int(next(lines).split(':')[1].strip().replace(' ', ''))
     return time, distance
 
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
@@ -106,6 +117,83 @@ def task_2(inputs):
     # Return the range
     return upper_edge - lower_edge + 1
 
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def ways_to_win(time, distance):
+    '''
+    Number of hold times that beat the record, in closed form. We win when
+    h*(time - h) > distance, i.e. strictly between the roots of
+    h^2 - time*h + distance = 0, which are (time -/+ sqrt(time^2 - 4*distance)) / 2.
+    math.isqrt gets the square root exactly for any size of int, and leaves the
+    lowest winning hold time off by at most one, which we correct by checking
+    it directly. The winning hold times are symmetric around time/2, so the
+    lowest one gives us the count.
+    '''
+
+    disc = time*time - 4*distance
+    if disc < 0:
+        return 0
+
+    # Nudge our estimate onto the lowest hold time that wins (holding for 0
+    # never moves the boat, so start at 1 like task_1 does)
+    lo = max((time - isqrt(disc)) // 2, 1)
+    while lo <= time // 2 and __f(lo, time) <= distance:
+        lo += 1
+    while lo > 1 and __f(lo - 1, time) > distance:
+        lo -= 1
+
+    if lo > time // 2 or __f(lo, time) <= distance:
+        return 0
+    return time - 2*lo + 1
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def ways_to_win_many(times, distances):
+    '''
+    ways_to_win() for a whole batch of races at once with NumPy. A float square
+    root is within one of the exact one while time^2 fits in an int64, so we
+    can fix up the lowest winning hold time with a couple of vectorized checks
+    like ways_to_win does. Races too long for that go through ways_to_win one
+    by one (exact, just not vectorized).
+    '''
+
+    times = np.asarray(times)
+    distances = np.asarray(distances)
+    if times.dtype == object or distances.dtype == object or (times.size > 0 and times.max() >= MAX_BATCH_TIME):
+        return np.array([ways_to_win(int(t), int(d)) for t, d in zip(times, distances)], dtype=object)
+
+    # No hold time goes further than time^2 / 4 or less than 0, so clamping the
+    # records to that range doesn't change the answers (and 4*distance fits)
+    times = times.astype(np.int64)
+    distances = np.clip(distances, -1, times*times // 4).astype(np.int64)
+
+    disc = times*times - 4*distances
+    root = np.floor(np.sqrt(np.maximum(disc, 0).astype(np.float64))).astype(np.int64)
+    half = times // 2
+
+    # Start below the lowest winning hold time, then step up until we're on it
+    lo = np.maximum((times - root) // 2 - 1, 1)
+    for _ in range(4):
+        lo = np.where((lo <= half) & (lo * (times - lo) <= distances), lo + 1, lo)
+
+    wins = (disc >= 0) & (lo <= half) & (lo * (times - lo) > distances)
+    return np.where(wins, times - 2*lo + 1, 0)
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+@engine(1, 'closed_form')
+def task_1_closed_form(inputs):
+    '''
+    Part 1 with ways_to_win() instead of trying every hold time
+    '''
+    times, distances = __parse_input(inputs)
+    return prod(ways_to_win(time, distance) for time, distance in zip(times, distances))
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+@engine(2, 'closed_form')
+def task_2_closed_form(inputs):
+    '''
+    Part 2 with ways_to_win() instead of the binary searches
+    '''
+    return ways_to_win(*__parse_input_2(inputs))
+
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def main():
 
@@ -116,7 +204,6 @@ def main():
     answer_1 = task_1(inputs)
     print(answer_1)
 
-    inputs = read_input(infile)
     answer_2 = task_2(inputs)
     print(answer_2)
 
@@ -5,12 +5,13 @@
 
 from pathlib import Path
 
+import sys
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc import loader
+
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def read_input(infile):
-    with open(infile, 'r') as f:
-        data = f.readlines()
-    data = [x.strip() for x in data]
-    return data
+    return loader.read_lines(infile)
 
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def __parse_input(inputs):
@@ -215,7 +216,6 @@ def main():
     answer_1 = task_1(inputs)
     print(answer_1)
 
-    inputs = read_input(infile)
     answer_2 = task_2(inputs)
     print(answer_2)
 
@@ -6,12 +6,14 @@
 from pathlib import Path
 import math
 
+import sys
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc import loader
+from aoc.parsing import words
+
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def read_input(infile):
-    with open(infile, 'r') as f:
-        data = f.readlines()
-    data = [x.strip() for x in data]
-    return data
+    return loader.read_lines(infile)
 
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def __parse_input(inputs):
@@ -26,10 +28,8 @@ def __parse_input(inputs):
     # Now get the rest of the datafile as a map of strings -> tuples of strings
     mapping = {}
     for i in range(2,len(inputs)):
-        line = inputs[i]
-        k, v = line.split(' = ')
-        v = v.replace('(', '').replace(')', '').replace(' ', '').split(',')
-        mapping[k] = v
+        k, left, right = words(inputs[i])
+        mapping[k] = [left, right]
 
     return first_line, mapping
 
@@ -100,7 +100,6 @@ def main():
     answer_1 = task_1(inputs)
     print(answer_1)
 
-    inputs = read_input(infile)
     answer_2 = task_2(inputs)
     print(answer_2)
 
@@ -6,26 +6,27 @@
 from pathlib import Path
 import math
 
+import sys
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc import loader, parallel
+from aoc.registry import engine
+
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def read_input(infile):
-    with open(infile, 'r') as f:
-        data = f.readlines()
-    data = [x.strip() for x in data]
-    return data
+    return loader.read_lines(infile)
 
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def __parse_input(inputs):
     '''
-    Helper function for parts 1 and 2
+    Helper function for parts 1 and 2 - lazily parse each line into a list of
+    ints, so we only ever hold one history at a time
     '''
-    
-    out = [x.split(' ') for x in inputs]
-    out = []
+
     for input in inputs:
         line = input.split(' ')
-        out.append([int(x) for x in line])
+        yield [int(x) for x in line]
 
-    return out
+    return
 
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def __get_updated_list(line):
@@ -100,6 +101,24 @@ def task_2(inputs):
     return
     
 
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+@engine(1, 'parallel')
+def task_1_parallel(inputs, workers=None):
+    '''
+    Part 1 split across worker processes - every history is extrapolated on its
+    own, so each chunk of histories is just a smaller task_1
+    '''
+    return parallel.chunked_sum(task_1, inputs, workers)
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+@engine(2, 'parallel')
+def task_2_parallel(inputs, workers=None):
+    '''
+    Part 2 split across worker processes - every history is extrapolated on its
+    own, so each chunk of histories is just a smaller task_2
+    '''
+    return parallel.chunked_sum(task_2, inputs, workers)
+
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def main():
 
@@ -110,7 +129,6 @@ def main():
     answer_1 = task_1(inputs)
     print(answer_1)
 
-    inputs = read_input(infile)
     answer_2 = task_2(inputs)
     print(answer_2)
 
@@ -4,54 +4,15 @@
 '''
 
 from pathlib import Path
-from queue import Queue
 
-#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-def read_input(infile):
-    with open(infile, 'r') as f:
-        data = f.readlines()
-    data = [x.strip() for x in data]
-    return data
-
-#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-def __find_S(inputs):
-
-    # Grid dimensions
-    m = len(inputs)
-    n = len(inputs[0])
-
-    # Just iterate until we find S
-    for i in range(m):
-        for j in range(n):
-            if (inputs[i][j] == 'S'):
-                return (i,j)
-
-    # Hopefully we never get here...
-    return None
+import sys
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc import loader
+from aoc.grid import Grid
 
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-def __add_neigh(neigh, direction, inputs, visited):
-
-    # Grid dimensions
-    m = len(inputs)
-    n = len(inputs[0])
-
-    # Mapping of what direction we came from to valid pipes for that direction
-    mapping = {
-        'west': {'-', 'J', '7'},
-        'south': {'|', '7', 'F'},
-        'east': {'-', 'F', 'L'},
-        'north': {'|', 'L', 'J'}
-    }
-
-    # If this neighbor is within dimensions, we haven't visited yet, and the pipe is the right direction, then Trues
-    if ((0 <= neigh[0] < m) and 
-        (0 <= neigh[1] < n) and
-        (neigh not in visited) and 
-        inputs[neigh[0]][neigh[1]] in mapping[direction]):
-        return True
-    else:
-        return False
+def read_input(infile):
+    return loader.read_lines(infile)
 
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def task_1(inputs, for_part_2:bool=False):
@@ -59,37 +20,30 @@ def task_1(inputs, for_part_2:bool=False):
     Main method for part 1, uses BFS to find main loop
     '''
 
-    # First find where S is
-    curr = __find_S(inputs)
-
-    # Directions to visit our potential neighbors
-    dirs = [(0, +1, 'west'), (-1, 0, 'south'), (0, -1, 'east'), (+1, 0, 'north')]
-
-    # Other variables we'll use in BFS
-    visited = set()
-    q = Queue()
+    # Cells we can step onto from each direction (east, north, west, south), given
+    # the pipe on the other side: e.g. stepping east we come in from the west
+    grid = Grid.from_lines(inputs)
+    pipes = ['-J7', '|7F', '-FL', '|LJ']
+    adjacency = grid.adjacency([grid.mask(x) for x in pipes])
 
-    # Add "S" to the queue
-    q.put(curr)
-    visited.add(curr)
+    # Start BFS from "S", working with flat grid indices
+    curr = grid.index(*grid.start)
+    visited = bytearray(grid.size)
+    visited[curr] = 1
+    frontier = [curr]
 
-    # BFS: Iterate until queue is empty
+    # BFS: Iterate until there's nothing left at the current distance away
     steps = 0
-    while (not q.empty()):
+    while frontier:
 
-        # Iterate through the current distance away
-        size = q.qsize()
-        for i in range(size):
-
-            # Get neighbors of curr
-            curr = q.get()
-            for dir in dirs:
-                neigh = (curr[0] + dir[0], curr[1] + dir[1])
-
-                # If we haven't visited this neighbor yet and it's a valid pipe, add it to queue
-                if __add_neigh(neigh, dir[2], inputs, visited):
-                    q.put(neigh)
-                    visited.add(neigh)
+        # If we haven't visited a neighbor yet and it's a valid pipe, it's part of the next distance away
+        next_frontier = []
+        for curr in frontier:
+            for neigh in adjacency[curr]:
+                if not visited[neigh]:
+                    visited[neigh] = 1
+                    next_frontier.append(neigh)
+        frontier = next_frontier
 
         # Increment our step
         steps += 1
@@ -97,7 +51,7 @@ def task_1(inputs, for_part_2:bool=False):
     # For part 2, return all the coordinates of the main loop
     # For part 1, return steps-1 since we went an extra iteration at the end
     if for_part_2:
-        return visited
+        return {grid.coords(k) for k in range(grid.size) if visited[k]}
     else:
         return steps-1
 
@@ -192,8 +146,8 @@ def __get_main_loop_map(inputs, init_dir:bool=True):
     m = len(inputs)
     n = len(inputs[0])
 
-    # First find where S is
-    S = __find_S(inputs)
+    # First find where S is (part 2 works on the strings, so no need for a Grid)
+    S = next((i, input.index('S')) for i, input in enumerate(inputs) if 'S' in input)
 
     # Helper variable for finding 2 starting neighbors of S
     dirs = [(0, +1, 'east',  {'-','J','7'}), 
@@ -298,7 +252,6 @@ def main():
     answer_1 = task_1(inputs)
     print(answer_1)
 
-    inputs = read_input(infile)
     answer_2 = task_2(inputs)
     print(answer_2)
 
@@ -6,12 +6,14 @@
 from pathlib import Path
 from queue import Queue
 
+import sys
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc import loader
+from aoc.grid import Grid
+
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def read_input(infile):
-    with open(infile, 'r') as f:
-        data = f.readlines()
-    data = [x.strip() for x in data]
-    return data
+    return loader.read_lines(infile)
 
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def __get_galaxies(inputs):
@@ -19,18 +21,8 @@ def __get_galaxies(inputs):
     Helper function for parts 1 and 2 to get the coordinates of all of our galaxies
     '''
 
-    # Grid dimensions
-    m = len(inputs)
-    n = len(inputs[0])
-
     # Get coordinates of all of our galaxies as a list of (row, col) tuples
-    out = []
-    for i in range(m):
-        for j in range(n):
-            if inputs[i][j] == '#':
-                out.append((i,j))
-
-    return out
+    return Grid.from_lines(inputs).find_all('#')
 
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def __get_rowscols_to_add(inputs, galaxies):
@@ -96,7 +88,7 @@ def task_1(inputs):
 
     # Get our initial set of galaxies, update our map, then get the new coordinates
     galaxies_initial = __get_galaxies(inputs)
-    inputs = __update_grid(inputs, galaxies_initial)
+    inputs = __update_grid(list(inputs), galaxies_initial)
     galaxies = __get_galaxies(inputs)
 
     # Iterate through each pair exactly once, adding distances to our sum
@@ -168,7 +160,6 @@ def main():
     answer_1 = task_1(inputs)
     print(answer_1)
 
-    inputs = read_input(infile)
     answer_2 = task_2(inputs)
     print(answer_2)
 
@@ -5,28 +5,27 @@
 
 from pathlib import Path
 
+import sys
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc import loader, parallel
+from aoc.registry import engine
+
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def read_input(infile):
-    with open(infile, 'r') as f:
-        data = f.readlines()
-    data = [x.strip() for x in data]
-    return data
+    return loader.read_lines(infile)
 
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def __parse_inputs(inputs):
     '''
-    Helper function for part 1 to parse our inputs into the format we want
+    Helper function for part 1 to parse our inputs into the format we want -
+    lazily yields a (string, numbers) pair per line
     '''
 
-    # We'll output an array of strings and array of numbers
-    string_arr = []
-    nums_arr = []
     for input in inputs:
         string, nums = input.split(' ')
-        string_arr.append(string)
-        nums_arr.append([int(x) for x in nums.split(',')])
+        yield string, [int(x) for x in nums.split(',')]
 
-    return string_arr, nums_arr
+    return
 
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def __is_still_possible(curr_str, given_str):
@@ -84,14 +83,11 @@ def __num_arrangements(curr_str, given_str, nums_left):
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def task_1(inputs):
     
-    # Get our inputs
-    string_arr, nums_arr = __parse_inputs(inputs)
-
     # Do for all the numbers!
     sum_out = 0
-    for i in range(len(string_arr)):
-        curr_str = '?' * len(string_arr[i])
-        curr_out = __num_arrangements(curr_str, string_arr[i], nums_arr[i])
+    for string, nums in __parse_inputs(inputs):
+        curr_str = '?' * len(string)
+        curr_out = __num_arrangements(curr_str, string, nums)
         sum_out += curr_out
 
     return sum_out
@@ -103,16 +99,12 @@ def __parse_inputs_v2(inputs):
     we'll have each line be 5 times as long
     '''
 
-    # We'll output an array of strings and array of numbers
-    string_arr = []
-    nums_arr = []
     for input in inputs:
         string, nums = input.split(' ')
         string = (string+'?')*5
-        string_arr.append(string[:-1])
-        nums_arr.append([int(x) for x in nums.split(',')] * 5)
+        yield string[:-1], [int(x) for x in nums.split(',')] * 5
 
-    return string_arr, nums_arr
+    return
 
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def __to_key(curr_str, curr_nums):
@@ -204,21 +196,28 @@ def __num_arrangements_v2(curr_str, curr_nums, memo):
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def task_2(inputs):
     '''
-    Dynamic programming in the form of recursion + memoization
+    Dynamic programming in the form of recursion + memoization. Memo keys hold
+    the rest of the row, so they hardly ever carry over to another row - keep a
+    memo per row so memory doesn't grow with the number of rows.
     '''
-    
-    # Get our inputs
-    string_arr, nums_arr = __parse_inputs_v2(inputs)
 
     # Do for all the numbers!
     sum_out = 0
-    memo = {}
-    for i in range(len(inputs)):
-        curr_out = __num_arrangements_v2(string_arr[i], nums_arr[i], memo)
+    for string, nums in __parse_inputs_v2(inputs):
+        curr_out = __num_arrangements_v2(string, nums, {})
         sum_out += curr_out
 
     return sum_out
     
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+@engine(2, 'parallel')
+def task_2_parallel(inputs, workers=None):
+    '''
+    Part 2 split across worker processes - every row is counted on its own (with
+    its own memo), so each chunk of rows is just a smaller task_2
+    '''
+    return parallel.chunked_sum(task_2, inputs, workers)
+
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def main():
 
@@ -229,7 +228,6 @@ def main():
     answer_1 = task_1(inputs)
     print(answer_1)
 
-    inputs = read_input(infile)
     answer_2 = task_2(inputs)
     print(answer_2)
 
@@ -4,14 +4,14 @@
 '''
 
 from pathlib import Path
-import numpy as np
+
+import sys
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc import loader
 
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def read_input(infile):
-    with open(infile, 'r') as f:
-        data = f.readlines()
-    data = [list(x.strip()) for x in data]
-    return data
+    return loader.read_lines(infile)
 
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def __get_sum(grid):
@@ -35,7 +35,7 @@ def __get_sum(grid):
 def task_1(inputs):
     
     # Grid dimensions
-    grid = inputs
+    grid = [list(row) for row in inputs]
     m = len(grid)
     n = len(grid[0])
 
@@ -172,7 +172,7 @@ def __to_str(grid):
 def task_2(inputs):
 
     # Some variables
-    grid = inputs
+    grid = [list(row) for row in inputs]
     hashmap = {}
 
     # Cycle to infinity! But in reality we should never have to iterate this far...
@@ -215,7 +215,6 @@ def main():
     answer_1 = task_1(inputs)
     print(answer_1)
 
-    inputs = read_input(infile)
     answer_2 = task_2(inputs)
     print(answer_2)
 
@@ -4,14 +4,14 @@
 '''
 
 from pathlib import Path
-import numpy as np
+
+import sys
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc import loader
 
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def read_input(infile):
-    with open(infile, 'r') as f:
-        data = f.readlines()
-    data = [x.strip().split(',') for x in data][0]
-    return data
+    return loader.read_lines(infile)[0].split(',')
 
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def __hash(string):
@@ -123,7 +123,6 @@ def main():
     answer_1 = task_1(inputs)
     print(answer_1)
 
-    inputs = read_input(infile)
     answer_2 = task_2(inputs)
     print(answer_2)
 
@@ -6,105 +6,75 @@
 from pathlib import Path
 from collections import deque
 
+import sys
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc import loader
+from aoc.grid import Grid
+
+# Indices into aoc.grid.DIRS, which is also how beam directions are stored
+EAST, NORTH, WEST, SOUTH = 0, 1, 2, 3
+
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def read_input(infile):
-    with open(infile, 'r') as f:
-        data = f.readlines()
-    data = [x.strip() for x in data]
-    return data
+    return loader.read_lines(infile)
 
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-def __get_outdir(grid, curr):
+def __get_outdir(grid_pt, indir):
     '''
-    Given an input 4-tuple (row, col, input-direction, None), return a list of 
-    potential 4-tuples with output direction included. Returned list should always
+    Given the character at a grid point and the direction a beam comes in with,
+    return a list of the directions it goes out in. Returned list should always
     be of length 1 or 2.
 
-        Ex1: (1, 4, '>', None) --------> [(1, 4, '>', 'v')] 
-        Ex2: (0, 1, '>', None) --------> [(0, 1, '>', '^'), (0, 1, '>', 'v')]
+        Ex1: ('\\', EAST) --------> [SOUTH]
+        Ex2: ('|', EAST)  --------> [NORTH, SOUTH]
     '''
 
-    # Unpack
-    row, col, indir, outdir = curr
-    assert outdir is None
-
-    # Determine if we're dealing with a '.', '-', '|', '/', or '\'
-    grid_pt = grid[row][col]
-
-    # If our out-direction (curr[3]) is the same as our in-direction
-    if (grid_pt == '.') or (grid_pt == '|' and indir in {'^','v'}) or (grid_pt == '-' and indir in {'<','>'}):
-        return [(row, col, indir, indir)]
-
-    # If we have a diagonal mirror
-    mapping = {
-        ('\\', '>') : 'v',
-        ('\\', '^') : '<', 
-        ('\\', 'v') : '>',
-        ('\\', '<') : '^', 
-        ('/',  '>') : '^',
-        ('/',  '^') : '>', 
-        ('/',  'v') : '<',
-        ('/',  '<') : 'v', 
-    }
-    if (grid_pt, indir) in mapping:
-        return [(row, col, indir, mapping[(grid_pt, indir)])]
-    
+    # If our out-direction is the same as our in-direction
+    if (grid_pt == '.') or (grid_pt == '|' and indir in {NORTH, SOUTH}) or (grid_pt == '-' and indir in {EAST, WEST}):
+        return [indir]
+
+    # If we have a diagonal mirror - '\' swaps east/south and north/west, '/'
+    # swaps east/north and west/south
+    if grid_pt == '\\':
+        return [3 - indir]
+    if grid_pt == '/':
+        return [indir ^ 1]
+
     # If we need to split into two
-    if (grid_pt == '|' and indir in {'>','<'}):
-        return [(row, col, indir, '^'), (row, col, indir, 'v')]
-    
+    if (grid_pt == '|' and indir in {EAST, WEST}):
+        return [NORTH, SOUTH]
+
     # Also if we need to split into two
-    if (grid_pt == '-' and indir in {'^','v'}):
-        return [(row, col, indir, '<'), (row, col, indir, '>')]
+    if (grid_pt == '-' and indir in {NORTH, SOUTH}):
+        return [WEST, EAST]
 
     raise SystemError
 
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-def __get_next(curr, m, n):
+def __get_tables(grid):
     '''
-    Given a 4-tuple (row, col, input-direction, output-direction), return another 
-    4-tuple (row, col, input-direction, None) for the next neighbor visited IF 
-    that neighbor is within grid dimensions. Otherwise, return None
-
-        Ex1: (0, 1, '>', '^') --------> None
-        Ex2: (0, 1, '>', 'v') --------> (1, 1, 'v', None)
+    Helper function for parts 1 and 2 - everything the simulation looks up, per
+    flat grid index k: outdirs[k][indir] is the list of out-directions (see
+    __get_outdir) and neighbors[k][outdir] the flat index of the next cell, or
+    -1 if it's outside of the grid
     '''
+    outdirs = [[__get_outdir(chr(code), indir) for indir in range(4)] for code in grid.data.ravel().tolist()]
+    return outdirs, grid.neighbors.tolist()
 
-    # Unpack 4-tuple
-    row, col, indir, outdir = curr
-    assert outdir is not None
-
-    # Figure out what our next grid cell is
-    outdir_map = {
-        '>' : (0, +1),
-        '<' : (0, -1),
-        '^' : (-1, 0),
-        'v' : (+1, 0)
-    }
-    incr = outdir_map[outdir]
-    row, col = row+incr[0], col+incr[1]
-
-    # If our next grid cell is within the map, return our next 4-tuple to look at
-    if 0 <= row < m and 0 <= col < n:
-        return (row, col, outdir, None)
-    
-    # Otherwise if it's outside of dimension of the map, return None
-    else:
-        return None
-    
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-def __simulate_energized(grid, start):
+def __simulate_energized(tables, start):
     '''
     Helper function for parts 1 and 2 to simulate "energization" of an entire grid
-    given a starting point. Uses Depth-First-Search (DFS) with a stack
+    given a starting point (k, input-direction). Uses Depth-First-Search (DFS)
+    with a stack
     '''
 
-    # Grid dimensions
-    m = len(grid)
-    n = len(grid[0])
+    outdirs, neighbors = tables
 
-    # Set of visited 4-tuples (excluding output-direction) so we don't loop indefinitely
-    visited = set()
+    # Visited (k, input-direction) pairs so we don't loop indefinitely, and the
+    # grid points we've visited at all
+    visited = bytearray(4 * len(neighbors))
+    energized = bytearray(len(neighbors))
 
     # Add our starting point to the stack
     st = deque()
@@ -114,60 +84,57 @@ def __simulate_energized(grid, start):
     while (len(st) > 0):
 
         # Pop our next value from the stack
-        curr = st.pop()
-        assert type(curr) == tuple and curr[3] is None
+        k, indir = st.pop()
 
         # If we've visited this permutation before, skip. Otherwise, add to visited
-        if curr in visited:
+        if visited[4*k + indir]:
             continue
-        else:
-            visited.add(curr)
-
-        # Get a list of the potential output directions we can go
-        potential_nexts = __get_outdir(grid, curr)
-        assert (type(potential_nexts) == list and len(potential_nexts) <= 2)
+        visited[4*k + indir] = 1
+        energized[k] = 1
 
-        # For each of the potential output directions, if we haven't visited yet
-        # and it's within the grid dimensions, add to our stack
-        for potential_next in potential_nexts:
-            next = __get_next(potential_next, m, n)
-            if next is not None and next not in visited:
-                st.append(next)
+        # For each of the potential output directions, if the next cell is within
+        # the grid dimensions and we haven't visited it that way yet, add to our stack
+        for outdir in outdirs[k][indir]:
+            next = neighbors[k][outdir]
+            if next >= 0 and not visited[4*next + outdir]:
+                st.append((next, outdir))
 
     # Finally, determine the amount of grid points we've visited ("energized")
-    numEnergized = len(set([(curr[0],curr[1]) for curr in visited]))
+    numEnergized = sum(energized)
     return numEnergized
 
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-def task_1(grid):
+def task_1(inputs):
     '''
     Task 1 main method
     '''
-    start = (0, 0, '>', None)
-    return __simulate_energized(grid, start)
+    grid = Grid.from_lines(inputs)
+    start = (grid.index(0, 0), EAST)
+    return __simulate_energized(__get_tables(grid), start)
 
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-def task_2(grid):
+def task_2(inputs):
     '''
     Task 2 main method
     '''
 
     # Grid dimensions
-    m = len(grid)
-    n = len(grid[0])
+    grid = Grid.from_lines(inputs)
+    m, n = grid.shape
+    tables = __get_tables(grid)
 
     # All the different amounts of number energized we can have from different starting places
     numEnergizedArr = []
 
     # Top row and bottom row
     for j in range(n):
-        numEnergizedArr.append(__simulate_energized(grid, (0, j, 'v', None)))
-        numEnergizedArr.append(__simulate_energized(grid, (m-1, j, '^', None)))
+        numEnergizedArr.append(__simulate_energized(tables, (grid.index(0, j), SOUTH)))
+        numEnergizedArr.append(__simulate_energized(tables, (grid.index(m-1, j), NORTH)))
 
     # Left column and bottom column
     for i in range(m):
-        numEnergizedArr.append(__simulate_energized(grid, (i, 0, '>', None)))
-        numEnergizedArr.append(__simulate_energized(grid, (i, n-1, '<', None)))
+        numEnergizedArr.append(__simulate_energized(tables, (grid.index(i, 0), EAST)))
+        numEnergizedArr.append(__simulate_energized(tables, (grid.index(i, n-1), WEST)))
 
     # Finally return the max number of energized
     return max(numEnergizedArr)
@@ -180,7 +147,6 @@ def main():
     inputs = read_input(infile)
     print(task_1(inputs))
 
-    inputs = read_input(infile)
     print(task_2(inputs))
 
     return
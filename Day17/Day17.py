@@ -4,60 +4,73 @@
 '''
 
 from pathlib import Path
-from queue import PriorityQueue
+from heapq import heappop, heappush
+
+import sys
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc import loader
+from aoc.grid import Grid
+
+# Indices into aoc.grid.DIRS of the directions we can start out in
+EAST, SOUTH = 0, 3
 
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def read_input(infile):
-    with open(infile, 'r') as f:
-        data = f.readlines()
-    data = [x.strip() for x in data]
-    return data
+    return loader.read_lines(infile)
 
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def __sim_paths(grid, part1=True):
     '''
     Helper function for parts 1 and 2 - use Dijkstra's algorithm to find the min
-    cost path between starting point and end state!
+    cost path between starting point and end state! Works on flat grid indices,
+    so a state is a 3-tuple (k, direction, numSteps) with the direction an index
+    into aoc.grid.DIRS (east, north, west, south)
     '''
 
-    # Other variables we'll use
+    # Heat loss of each cell and each cell's neighbor in each direction (-1 off
+    # the grid), as plain lists for the hot loop
+    costs = (grid.data.ravel() - ord('0')).tolist()
+    neighbors = grid.neighbors.tolist()
+    end = grid.size - 1
+
+    # Other variables we'll use (a plain heapq list for the priority queue -
+    # queue.PriorityQueue locks on every put and get)
     visited = {}
-    pq = PriorityQueue()
+    pq = []
 
     # Add start point(s) to the priority queue
-    start1 = (0, 0, '>', 0) 
-    pq.put((0, start1))
+    start1 = (0, EAST, 0)
+    heappush(pq, (0, start1))
     visited[start1] = 0
 
     # Add start point(s) to the priority queue
-    start2 = (0, 0, 'v', 0)
-    pq.put((0, start2))
+    start2 = (0, SOUTH, 0)
+    heappush(pq, (0, start2))
     visited[start2] = 0
 
     # Dijkstra: Iterate until queue is empty
-    while (not pq.empty()):
+    while (len(pq) > 0):
 
         # Get current node/state, and also its priority (cost_so_far)
-        cost_so_far, curr = pq.get()
+        cost_so_far, curr = heappop(pq)
 
         # If this is our endpoint -> return!
-        if (curr[0] == len(grid)-1) and (curr[1] == len(grid[0])-1) and (part1 or curr[3] >= 4):
+        if curr[0] == end and (part1 or curr[2] >= 4):
             return cost_so_far
 
-        # Otherwise, get each of this node's neighbors  
-        neighs = __get_neighs(grid, curr) if part1 else __get_neighs_v2(grid, curr)
+        # Otherwise, get each of this node's neighbors
+        neighs = __get_neighs(neighbors, curr) if part1 else __get_neighs_v2(neighbors, curr)
 
         # For each neighbor in list of neighbors...
         for neigh in neighs:
 
             # Calculate the new cost total cost to get to this state
-            added_cost = int(grid[neigh[0]][neigh[1]])
-            total_cost = cost_so_far + added_cost
+            total_cost = cost_so_far + costs[neigh[0]]
 
             # If we haven't visited this state, add it's cost to our dict and add to pq
             if neigh not in visited:
                 visited[neigh] = total_cost
-                pq.put((total_cost, neigh))
+                heappush(pq, (total_cost, neigh))
 
             # If we have visited this state but our new path is better, update dict and add to pq
             elif neigh in visited and total_cost < visited[neigh]:
@@ -67,52 +80,27 @@ def __sim_paths(grid, part1=True):
     raise SystemError()
 
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-def __get_neighs(grid, curr):
+def __get_neighs(neighbors, curr):
     '''
     Helper function for part 1 - get neighbor states of current "state".
-    State represented by a 4-tuple (row, col, direction, numSteps)
+    State represented by a 3-tuple (k, direction, numSteps)
     '''
 
-    # Grid dimensions
-    m = len(grid)
-    n = len(grid[0])
-
     # Unpack current state
-    row, col, direction, numSteps = curr
+    k, direction, numSteps = curr
 
-    # Directions to visit our potential neighbors - order is left, straight, right
-    mapping = {
-        '>': [(-1, 0), (0, +1), (+1, 0)],
-        'v': [(0, +1), (+1, 0), (0, -1)],
-        '<': [(+1, 0), (0, -1), (-1, 0)],
-        '^': [(0, -1), (-1, 0), (0, +1)]
-    }
-    potential_neighs = mapping[direction]
-
-    # Adjacent directions
-    left  = {'>':'^', 'v':'>', '<':'v', '^':'<'}
-    right = {'>':'v', 'v':'<', '<':'^', '^':'>'}
+    # Turning left or right (aoc.grid.DIRS goes counterclockwise), or going straight
+    left, right = (direction + 1) % 4, (direction + 3) % 4
 
     # Iterate through each potential neighbor to see if it's a valid neighbor to add
+    # (-1 means we'd be outside of dimensions)
     out = []
-    for i,potential_neigh in enumerate(potential_neighs):
-        neigh_row, neigh_col = row+potential_neigh[0], col+potential_neigh[1]
-
-        # Don't add if we're outside of dimensions
-        if not ((0 <= neigh_row < m) and (0 <= neigh_col < n)):
-            continue
-
-        # Turn left
-        if i == 0:
-            out.append((neigh_row, neigh_col, left[direction], 1))
-
-        # Turn right
-        elif i == 2: 
-            out.append((neigh_row, neigh_col, right[direction], 1))
-
-        # Straight (and less than 3 steps)
-        elif numSteps < 3:
-            out.append((neigh_row, neigh_col, direction, numSteps+1))
+    if neighbors[k][left] >= 0:
+        out.append((neighbors[k][left], left, 1))
+    if numSteps < 3 and neighbors[k][direction] >= 0:
+        out.append((neighbors[k][direction], direction, numSteps+1))
+    if neighbors[k][right] >= 0:
+        out.append((neighbors[k][right], right, 1))
 
     return out
 
@@ -121,59 +109,32 @@ def task_1(inputs):
     '''
     Task 1 main method - use Dijkstra's algorithm
     '''
-    min_heat_loss = __sim_paths(inputs)
+    min_heat_loss = __sim_paths(Grid.from_lines(inputs))
     return  min_heat_loss
 
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-def __get_neighs_v2(grid, curr):
+def __get_neighs_v2(neighbors, curr):
     '''
     Helper function for part 2 - get neighbor states of current "state".
-    State represented by a 4-tuple (row, col, direction, numSteps)
+    State represented by a 3-tuple (k, direction, numSteps)
     '''
 
-    # Grid dimensions
-    m = len(grid)
-    n = len(grid[0])
-
     # Unpack current state
-    row, col, direction, numSteps = curr
+    k, direction, numSteps = curr
 
-    # Directions to visit our potential neighbors - order is left, straight, right
-    mapping = {
-        '>': [(-1, 0), (0, +1), (+1, 0)],
-        'v': [(0, +1), (+1, 0), (0, -1)],
-        '<': [(+1, 0), (0, -1), (-1, 0)],
-        '^': [(0, -1), (-1, 0), (0, +1)]
-    }
-    potential_neighs = mapping[direction]
-
-    # Adjacent directions
-    left  = {'>':'^', 'v':'>', '<':'v', '^':'<'}
-    right = {'>':'v', 'v':'<', '<':'^', '^':'>'}
+    # Turning left or right (aoc.grid.DIRS goes counterclockwise), or going straight
+    left, right = (direction + 1) % 4, (direction + 3) % 4
 
     # Iterate through each potential neighbor to see if it's a valid neighbor to add
+    # (-1 means we'd be outside of dimensions). Turns only after 4 steps, and at
+    # most 10 steps straight.
     out = []
-    for i,potential_neigh in enumerate(potential_neighs):
-        neigh_row, neigh_col = row+potential_neigh[0], col+potential_neigh[1]
-
-        # Don't add if we're outside of dimensions
-        if not ((0 <= neigh_row < m) and (0 <= neigh_col < n)):
-            continue
-
-        # Turn left
-        if i == 0:
-            if numSteps >= 4:
-                out.append((neigh_row, neigh_col, left[direction], 1))
-
-        # Turn right
-        elif i == 2: 
-            if numSteps >= 4:
-                out.append((neigh_row, neigh_col, right[direction], 1))
-
-        # Straight
-        else:
-            if numSteps < 10:
-                out.append((neigh_row, neigh_col, direction, numSteps+1))
+    if numSteps >= 4 and neighbors[k][left] >= 0:
+        out.append((neighbors[k][left], left, 1))
+    if numSteps < 10 and neighbors[k][direction] >= 0:
+        out.append((neighbors[k][direction], direction, numSteps+1))
+    if numSteps >= 4 and neighbors[k][right] >= 0:
+        out.append((neighbors[k][right], right, 1))
 
     return out
 
@@ -182,7 +143,7 @@ def task_2(inputs):
     '''
     Task 2 main method - use Dijkstra's algorithm (again!)
     '''
-    min_heat_loss = __sim_paths(inputs, part1=False)
+    min_heat_loss = __sim_paths(Grid.from_lines(inputs), part1=False)
     return  min_heat_loss
     
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
@@ -193,7 +154,6 @@ def main():
     inputs = read_input(infile)
     print(task_1(inputs))
 
-    inputs = read_input(infile)
     print(task_2(inputs))
 
     return
@@ -6,12 +6,14 @@
 from pathlib import Path
 from copy import deepcopy
 
+import sys
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc import loader
+from aoc.parsing import ints
+
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def read_input(infile):
-    with open(infile, 'r') as f:
-        data = f.readlines()
-    data = [x.strip() for x in data]
-    return data
+    return loader.read_lines(infile)
 
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def __parse_input(inputs):
@@ -35,11 +37,9 @@ def __parse_input(inputs):
     # "ratings" will be a list of dicts with key = 'x','m','a', or 's' and
     # value = integer
     ratings = []
+    # (ratings always come in x, m, a, s order)
     for j in range(i+1, len(inputs)):
-        row = inputs[j]
-        row = row.replace('{', '').replace('}', '').split(',')
-        row = {x.split('=')[0]:int(x.split('=')[1]) for x in row}
-        ratings.append(row)
+        ratings.append(dict(zip('xmas', ints(inputs[j]))))
 
     return workflows, ratings
 
@@ -270,7 +270,6 @@ def main():
     inputs = read_input(infile)
     print(task_1(inputs))
 
-    inputs = read_input(infile)
     print(task_2(inputs))
 
     return
@@ -7,12 +7,13 @@ from pathlib import Path
 from queue import Queue
 import math
 
+import sys
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc import loader
+
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def read_input(infile):
-    with open(infile, 'r') as f:
-        data = f.readlines()
-    data = [x.strip() for x in data]
-    return data
+    return loader.read_lines(infile)
 
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 class broadcaster():
@@ -237,7 +238,6 @@ def main():
     inputs = read_input(infile)
     print(task_1(inputs))
 
-    inputs = read_input(infile)
     print(task_2(inputs))
 
     return
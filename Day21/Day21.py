@@ -5,56 +5,36 @@
 
 from pathlib import Path
 from queue import Queue
-import numpy as np
+
+import sys
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc import loader
+from aoc.lazy import lazy_import
+from aoc.grid import Grid
+
+# NumPy only gets loaded once something (the grid, the part 2 fit) uses it
+np = lazy_import('numpy')
 
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def read_input(infile):
-    with open(infile, 'r') as f:
-        data = f.readlines()
-    data = [x.strip() for x in data]
-    return data
+    return loader.read_lines(infile)
 
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def __find_S(grid):
     '''
-    Helper function for parts 1 and 2 to identify the location of the starting "S"
+    Helper function for part 2 to identify the location of the starting "S" (part
+    1 gets it from its Grid)
     '''
-    for i in range(len(grid)):
-        for j in range(len(grid[0])):
-            if grid[i][j] == 'S':
-                return (i, j) 
+    for i, row in enumerate(grid):
+        if 'S' in row:
+            return (i, row.index('S'))
     raise SystemError()
 
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-def __get_neighs(grid, curr):
+def __BFS(grid, start, numSteps=64):
     '''
-    Helper function for part 1 - get the neighbors of our current node assuming 
-    that we can't extend pass the dimensions of a single grid.
-    '''
-
-    # Grid dimensions
-    m = len(grid)
-    n = len(grid[0])
-
-    # Directions to visit our potential neighbors
-    dirs = [(0, +1), (-1, 0), (0, -1), (+1, 0)]
-
-    # Iterate through each potential neighbor direction...
-    neighs = []
-    for dir in dirs:
-        neigh_row, neigh_col = curr[0] + dir[0], curr[1] + dir[1]
-
-        # If this neighbor is within grid dimensions and not blocked, add it to valid list
-        if (0 <= neigh_row < m) and (0 <= neigh_col < n) and grid[neigh_row][neigh_col] != '#':
-            neighs.append((neigh_row, neigh_col))
-
-    return neighs
-
-#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-def __BFS(grid, start, part1=True, numSteps=64):
-    '''
-    Helper function for parts 1 and 2 - perform breadth-first-search (BFS) on our
-    grid for an input number of steps
+    Helper function for part 2 - perform breadth-first-search (BFS) on our
+    infinitely repeating grid for an input number of steps
     '''
 
     # Boolean indicating if we're taking an even or odd # of steps (init "sum_out" accordingly)
@@ -84,7 +64,7 @@ def __BFS(grid, start, part1=True, numSteps=64):
             curr = q.get()
 
             # Get neighbors of curr node
-            neighs = __get_neighs(grid, curr) if part1 else __get_neighs_v2(grid, curr)
+            neighs = __get_neighs_v2(grid, curr)
             for neigh in neighs:
 
                 # If we haven't visited this node yet, add to queue and add to visited set
@@ -100,14 +80,50 @@ def __BFS(grid, start, part1=True, numSteps=64):
                 
     return sum_out
 
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def __BFS_flat(grid, start, numSteps=64):
+    '''
+    Helper function for part 1 - same idea as __BFS, but on a single (bounded)
+    grid using flat grid indices and a precomputed list of open neighbors per cell
+    '''
+
+    # Boolean indicating if we're taking an even or odd # of steps (init "sum_out" accordingly)
+    even = (numSteps % 2 == 0)
+    sum_out = 1 if even else 0
+
+    # Start BFS from our start point
+    adjacency = grid.adjacency()
+    curr = grid.index(*start)
+    visited = bytearray(grid.size)
+    visited[curr] = 1
+    frontier = [curr]
+
+    # BFS: Iterate until we've taken all our steps
+    for steps in range(1, numSteps+1):
+
+        # If we haven't visited a neighbor yet, it's part of the next step
+        next_frontier = []
+        for curr in frontier:
+            for neigh in adjacency[curr]:
+                if not visited[neigh]:
+                    visited[neigh] = 1
+                    next_frontier.append(neigh)
+        frontier = next_frontier
+
+        # Update our output value (depending if we have an even or odd # of steps)
+        if steps % 2 == numSteps % 2:
+            sum_out += len(frontier)
+
+    return sum_out
+
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def task_1(inputs):
     '''
     Task 1 main method - use BFS to simulate how many garden plots we can reach
     in our allocated 64 steps
     '''
-    start = __find_S(inputs)
-    out = __BFS(inputs, start)
+    grid = Grid.from_lines(inputs)
+    out = __BFS_flat(grid, grid.start)
     return out
 
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
@@ -176,7 +192,7 @@ def task_2(inputs):
     
     # Just iterate through a few small values of "X" (i.e., a few small full grids-worth)
     for x in range(0, 4):
-        y = __BFS(inputs, start, part1=False, numSteps=start[0]+x*M) 
+        y = __BFS(inputs, start, numSteps=start[0]+x*M) 
         Xs.append(x)
         Ys.append(y)
 
@@ -205,7 +221,6 @@ def main():
     inputs = read_input(infile)
     print(task_1(inputs))
 
-    inputs = read_input(infile)
     print(task_2(inputs))
 
     return
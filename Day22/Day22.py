@@ -6,12 +6,14 @@
 from pathlib import Path
 from queue import Queue, PriorityQueue
 
+import sys
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc import loader
+from aoc.parsing import ints
+
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def read_input(infile):
-    with open(infile, 'r') as f:
-        data = f.readlines()
-    data = [x.strip() for x in data]
-    return data
+    return loader.read_lines(infile)
 
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def __get_locs(endpoints, only_bottom_z=False):
@@ -74,9 +76,8 @@ def __parse_inputs(inputs):
 
         # Start and endpoints of object as a tuple of lists (I'm not the most
         # consistent in this script with my usage of tuples vs lists whoops)
-        start,end = input.split('~')
-        start = [int(x) for x in start.split(',')]
-        end = [int(x) for x in end.split(',')]
+        coords = ints(input)
+        start, end = coords[0:3], coords[3:6]
 
         # "objs" contains a mapping of brick id's to brick endpoints
         objs[id+1] = (start, end)
@@ -274,7 +275,6 @@ def main():
     inputs = read_input(infile)
     print(task_1(inputs))
 
-    inputs = read_input(infile)
     print(task_2(inputs))
 
     return
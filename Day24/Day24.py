@@ -4,15 +4,19 @@
 '''
 
 from pathlib import Path
-from scipy.optimize import fsolve 
-import numpy as np
+
+import sys
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc import loader
+from aoc.parsing import ints
+from aoc.lazy import lazy_import
+
+# Only part 2 needs NumPy/SciPy, don't make part 1 pay for importing them
+np = lazy_import('numpy')
 
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def read_input(infile):
-    with open(infile, 'r') as f:
-        data = f.readlines()
-    data = [x.strip() for x in data]
-    return data
+    return loader.read_lines(infile)
 
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def __parse_inputs(inputs):
@@ -20,17 +24,14 @@ def __parse_inputs(inputs):
     Helper function for parts 1 and 2 - parse inputs into position and velocity lists
     '''
 
-    # List of position lists and list of velocity lists
-    poss = []
-    vels = []
+    # Python ints rather than a NumPy array, since the collision math multiplies
+    # these big numbers together and would overflow (and part 1 has no other
+    # use for NumPy)
+    hailstones = [ints(input) for input in inputs]
 
-    # Iterate through each hailstone, adding it's pos/vel to corresponding list
-    for input in inputs:
-        pos, vel = input.split(' @ ')
-        pos = [int(x) for x in pos.split(', ')]
-        vel = [int(x) for x in vel.split(', ')]
-        poss.append(pos)
-        vels.append(vel)
+    # List of position lists and list of velocity lists
+    poss = [hailstone[0:3] for hailstone in hailstones]
+    vels = [hailstone[3:6] for hailstone in hailstones]
 
     return poss, vels
 
@@ -207,6 +208,7 @@ def task_2(inputs):
     vels = vels[0:3]
 
     # Use our root solver to find our position/velocity of our rock
+    from scipy.optimize import fsolve
     x0 = [1,1,1,1,1,1]
     root = fsolve(__f, x0, args=(poss, vels), xtol=1e-14)
 
@@ -224,7 +226,6 @@ def main():
     inputs = read_input(infile)
     print(task_1(inputs))
 
-    inputs = read_input(infile)
     print(task_2(inputs))
 
     return
@@ -0,0 +1,4 @@
+'''
+    What: Advent of Code 2023 - shared helpers for running the daily solutions
+    Who: Josh Geiser
+'''
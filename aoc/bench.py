@@ -0,0 +1,198 @@
+'''
+    What: Advent of Code 2023 - benchmark every day against scaled synthetic inputs
+    Who: Josh Geiser
+
+    For each day we generate inputs at a few scales (1x is about the size of the
+    real puzzle input), time each part on each of them and report how the run
+    time grows with the input. A scaling exponent well above 1 (time ~ scale^k)
+    points at the parts that will blow up first.
+
+    Usage (from the repository root):
+        python -m aoc.bench                          # every day at 1x, 10x, 100x
+        python -m aoc.bench --days 3 12 --scales 1 10
+        python -m aoc.bench --budget 30 --out bench_results.json
+'''
+
+import argparse
+import json
+import math
+import multiprocessing
+import random
+import time
+
+from aoc.generators import GENERATORS
+from aoc.runner import ROOT, SLOW_PARTS, find_days, get_jobs, run_part
+
+# Where generated inputs go (they can get big, so they're kept out of git)
+INPUT_DIR = ROOT / 'bench_inputs'
+
+# Parts whose scaling exponent is above this get flagged in the report
+EXPONENT_WARNING = 1.5
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def make_input(day, scale, seed=0):
+    '''
+    Generate (or reuse) the synthetic input for a day at a given scale. Returns
+    the path to the input file.
+    '''
+
+    INPUT_DIR.mkdir(exist_ok=True)
+    path = INPUT_DIR / f'Day{day:02d}_x{scale}_s{seed}.txt'
+    if not path.exists():
+        rng = random.Random(f'{day}-{scale}-{seed}')
+        path.write_text(GENERATORS[day](scale, rng))
+
+    return path
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def __bench_worker(conn, module_name, part, infile):
+    '''
+    Helper function - run a single part in a child process and send back either
+    its result or the exception it raised
+    '''
+    try:
+        conn.send(run_part(module_name, part, infile))
+    except Exception as e:
+        conn.send({'answer': f'ERROR: {e!r}', 'time': None, 'rss': None})
+    conn.close()
+    return
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def time_part(module_name, part, infile, budget):
+    '''
+    Time one part against one input in a fresh process, giving up after "budget"
+    seconds. Returns the run_part result dict, or None if we ran out of time.
+    '''
+
+    ctx = multiprocessing.get_context('spawn')
+    recv, send = ctx.Pipe(duplex=False)
+    proc = ctx.Process(target=__bench_worker, args=(send, module_name, part, infile))
+    proc.start()
+    send.close()
+
+    result = recv.recv() if recv.poll(budget) else None
+    if result is None:
+        proc.terminate()
+    proc.join()
+
+    return result
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def scaling_exponent(points):
+    '''
+    Least-squares slope of log(time) against log(bytes) - i.e. k in time ~ n^k
+    '''
+
+    points = [(math.log(n), math.log(t)) for n, t in points if t and t > 0]
+    if len(points) < 2:
+        return None
+
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    var_x = sum((x - mean_x)**2 for x, _ in points)
+    if var_x == 0:
+        return None
+
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / var_x
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def run_bench(jobs, scales, budget, seed=0):
+    '''
+    Time every (day, part) job at every scale, smallest scale first. Once a part
+    runs out of time we don't bother trying it on anything bigger.
+    '''
+
+    results = {}
+    for day, part, module_name in sorted(jobs):
+        curve = []
+        for scale in sorted(scales):
+            infile = make_input(day, scale, seed)
+            text = infile.read_bytes()
+            result = time_part(module_name, part, infile, budget)
+
+            point = {'scale': scale, 'bytes': len(text), 'lines': text.count(b'\n') + 1}
+            if result is None:
+                point.update({'time': None, 'answer': None, 'timed_out': True})
+            else:
+                point.update({'time': result['time'], 'answer': result['answer'], 'rss': result['rss']})
+                if result['time']:
+                    point['throughput'] = len(text) / result['time']
+            curve.append(point)
+
+            elapsed = 'timeout' if result is None else f'{result["time"]:.3f} s'
+            print(f'Day {day:>2} part {part} x{scale:<4} {elapsed}', flush=True)
+            if result is None:
+                break
+
+        exponent = scaling_exponent([(p['bytes'], p['time']) for p in curve])
+        results[f'{day}.{part}'] = {'day': day, 'part': part, 'curve': curve, 'exponent': exponent}
+
+    return results
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def print_report(results, scales):
+    '''
+    Print per-scale times, throughput at the largest scale that finished and the
+    scaling exponent for each part
+    '''
+
+    scales = sorted(scales)
+    header = '  '.join(f'{"x" + str(s):>9}' for s in scales)
+    print(f'{"Day":>3}  {"Part":>4}  {header}  {"MB/s":>8}  {"Exponent":>8}')
+    print('-' * (36 + 11 * len(scales)))
+    for entry in sorted(results.values(), key=lambda x: (x['day'], x['part'])):
+        times = {p['scale']: p for p in entry['curve']}
+        cols = []
+        for scale in scales:
+            point = times.get(scale)
+            if point is None:
+                cols.append(f'{"-":>9}')
+            elif point['time'] is None:
+                cols.append(f'{"timeout":>9}')
+            else:
+                cols.append(f'{point["time"]:>9.3f}')
+
+        finished = [p for p in entry['curve'] if p.get('throughput')]
+        mbps = f'{finished[-1]["throughput"] / 2**20:.2f}' if finished else '-'
+        exponent = entry['exponent']
+        flag = ' !' if exponent is not None and exponent > EXPONENT_WARNING else ''
+        exponent = '-' if exponent is None else f'{exponent:.2f}'
+        print(f'{entry["day"]:>3}  {entry["part"]:>4}  {"  ".join(cols)}  {mbps:>8}  {exponent:>8}{flag}')
+
+    return
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark Advent of Code 2023 solutions on synthetic inputs')
+    parser.add_argument('--days', type=int, nargs='+', help='days to benchmark (default: all)')
+    parser.add_argument('--parts', type=int, nargs='+', help='parts to benchmark (default: all)')
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100], help='input scales to run')
+    parser.add_argument('--budget', type=float, default=60, help='seconds allowed per run before giving up on larger scales')
+    parser.add_argument('--seed', type=int, default=0, help='seed for the input generators')
+    parser.add_argument('--out', default='bench_results.json', help='where to write the throughput curves')
+    parser.add_argument('--all', action='store_true', help=f'also run the slow parts {sorted(SLOW_PARTS)}')
+    return parser.parse_args(argv)
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def main(argv=None):
+
+    args = parse_args(argv)
+
+    days = find_days()
+    jobs = get_jobs(days, args.days, args.parts, include_slow=args.all)
+    jobs = [job for job in jobs if job[0] in GENERATORS]
+
+    start = time.perf_counter()
+    results = run_bench(jobs, args.scales, args.budget, args.seed)
+    print()
+    print_report(results, args.scales)
+    print(f'Total wall-clock: {time.perf_counter() - start:.3f} s')
+
+    with open(ROOT / args.out, 'w') as f:
+        json.dump({'scales': sorted(args.scales), 'seed': args.seed, 'results': results}, f, indent=2)
+
+    return
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+if __name__ == '__main__':
+    main()
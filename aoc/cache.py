@@ -0,0 +1,73 @@
+'''
+    What: Advent of Code 2023 - on-disk cache of answers we've already computed
+    Who: Josh Geiser
+
+    Answers are keyed on the day, the part, the SHA-256 of the input file and the
+    SHA-256 of the day's module source. Changing either the input or the day's
+    code is a cache miss; anything else (e.g. the shared helpers in aoc/) is not,
+    so pass --force to the runner after changing those.
+'''
+
+import hashlib
+import json
+from pathlib import Path
+
+# Where cached answers live (one small JSON file per day/part/input/source)
+CACHE_DIR = Path(__file__).resolve().parents[1] / '.aoc_cache'
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def __sha256(path):
+    '''
+    Helper function - hex SHA-256 of a file's contents
+    '''
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(2**20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def cache_key(day, part, infile, source):
+    '''
+    Key for one (day, part) answer given the input file and the module's source
+    file. Returns None if either file is missing, in which case we don't cache.
+    '''
+    try:
+        input_hash = __sha256(infile)
+        source_hash = __sha256(source)
+    except FileNotFoundError:
+        return None
+
+    return f'Day{day:02d}_part{part}_{input_hash[:16]}_{source_hash[:16]}'
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def load(key):
+    '''
+    Cached result dict for a key, or None on a miss
+    '''
+    if key is None:
+        return None
+
+    path = CACHE_DIR / f'{key}.json'
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def store(key, result):
+    '''
+    Save a result dict (answer plus how long it took to compute) under a key
+    '''
+    if key is None:
+        return
+
+    CACHE_DIR.mkdir(exist_ok=True)
+    path = CACHE_DIR / f'{key}.json'
+    tmp = path.with_suffix('.tmp')
+    with open(tmp, 'w') as f:
+        json.dump({'answer': result['answer'], 'time': result['time']}, f)
+    tmp.replace(path)
+
+    return
@@ -0,0 +1,692 @@
+'''
+    What: Advent of Code 2023 - synthetic input generators for every day
+    Who: Josh Geiser
+
+    Each generator takes a "scale" (1 is roughly the size of a real puzzle input,
+    10 and 100 are ten and a hundred times that workload) and a random.Random
+    instance, and returns the text of an input file in that day's format. The
+    inputs are built so the existing task_1/task_2 can actually solve them (e.g.
+    Day 10 has a single closed loop, Day 20 has the counter/conjunction structure
+    part 2 relies on, Day 24 has a rock that hits every hailstone).
+'''
+
+import math
+import string
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def __side(base, scale, odd=False):
+    '''
+    Helper function for the grid days - grow a grid side so that the number of
+    cells (rather than the side length) scales with "scale"
+    '''
+    side = round(base * math.sqrt(scale))
+    if odd and side % 2 == 0:
+        side += 1
+    return side
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def __names(rng, count, length=None, alphabet=string.ascii_lowercase, reserved=()):
+    '''
+    Helper function - get "count" unique random names. If no length is given, use
+    the shortest length that leaves plenty of room to choose from.
+    '''
+    if length is None:
+        length = 2
+        while len(alphabet) ** length < 4 * count:
+            length += 1
+
+    names = set()
+    while len(names) < count:
+        name = ''.join(rng.choice(alphabet) for _ in range(length))
+        if name not in reserved:
+            names.add(name)
+
+    return list(names)
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def __pipe(prev, curr, next):
+    '''
+    Helper function for Day 10 - the pipe character at "curr" connecting the
+    neighboring cells "prev" and "next"
+    '''
+    openings = set()
+    for other in (prev, next):
+        openings.add((other[0] - curr[0], other[1] - curr[1]))
+
+    mapping = {
+        frozenset({(-1, 0), (+1, 0)}): '|',
+        frozenset({(0, -1), (0, +1)}): '-',
+        frozenset({(-1, 0), (0, +1)}): 'L',
+        frozenset({(-1, 0), (0, -1)}): 'J',
+        frozenset({(+1, 0), (0, -1)}): '7',
+        frozenset({(+1, 0), (0, +1)}): 'F',
+    }
+    return mapping[frozenset(openings)]
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def __teeth(rng, num_teeth, max_len, height):
+    '''
+    Helper function for Days 10 and 18 - describe a simple closed rectilinear
+    loop as a list of (direction, length) moves. Starting at the top-left corner
+    we go right along the top edge, dipping down into "teeth" as we go, then down
+    the right side, left along the bottom and back up the left side.
+    '''
+
+    moves = []
+    for _ in range(num_teeth):
+        depth = rng.randint(1, height - 2)
+        moves.append(('R', rng.randint(2, max_len)))
+        moves.append(('D', depth))
+        moves.append(('R', rng.randint(1, max_len)))
+        moves.append(('U', depth))
+    moves.append(('R', rng.randint(2, max_len)))
+
+    width = sum(length for dir, length in moves if dir == 'R')
+    moves += [('D', height), ('L', width), ('U', height)]
+
+    return moves
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def day01(scale, rng):
+    '''
+    Calibration lines - scale is the number of lines (1000 per unit). Every line
+    gets at least one real digit so part 1 always has something to find.
+    '''
+    words = ['one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine']
+
+    lines = []
+    for _ in range(1000 * scale):
+        chunks = [rng.choice(string.digits[1:])]
+        for _ in range(rng.randint(1, 8)):
+            kind = rng.random()
+            if kind < 0.3:
+                chunks.append(rng.choice(words))
+            elif kind < 0.5:
+                chunks.append(rng.choice(string.digits[1:]))
+            else:
+                chunks.append(''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(1, 4))))
+        rng.shuffle(chunks)
+        lines.append(''.join(chunks))
+
+    return '\n'.join(lines)
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def day02(scale, rng):
+    '''
+    Cube games - scale is the number of games (100 per unit)
+    '''
+    lines = []
+    for id in range(1, 100 * scale + 1):
+        draws = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(['red', 'green', 'blue'], rng.randint(1, 3))
+            draws.append(', '.join(f'{rng.randint(1, 20)} {color}' for color in colors))
+        lines.append(f'Game {id}: ' + '; '.join(draws))
+
+    return '\n'.join(lines)
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def day03(scale, rng):
+    '''
+    Engine schematic - square grid of 140x140 cells per unit
+    '''
+    side = __side(140, scale)
+    symbols = '*#+$/@=%&-'
+
+    lines = []
+    for _ in range(side):
+        row = ''
+        while len(row) < side:
+            kind = rng.random()
+            if kind < 0.08 and len(row) + 4 <= side:
+                row += str(rng.randint(1, 999)) + '.'
+            elif kind < 0.10:
+                row += '*' if rng.random() < 0.5 else rng.choice(symbols)
+            else:
+                row += '.'
+        lines.append(row[:side])
+
+    return '\n'.join(lines)
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def day04(scale, rng):
+    '''
+    Scratchcards - scale is the number of cards (200 per unit). Cards never win
+    copies of cards past the end of the table.
+    '''
+    numCards = 200 * scale
+    width = len(str(numCards))
+
+    lines = []
+    for card in range(1, numCards + 1):
+        numMatches = min(int(rng.expovariate(0.6)), 10, numCards - card)
+        winning = rng.sample(range(1, 100), 10)
+        others = rng.sample([x for x in range(1, 100) if x not in winning], 25 - numMatches)
+        held = rng.sample(winning, numMatches) + others
+        rng.shuffle(held)
+
+        left = ' '.join(f'{x:>2}' for x in winning)
+        right = ' '.join(f'{x:>2}' for x in held)
+        lines.append(f'Card {card:>{width}}: {left} | {right}')
+
+    return '\n'.join(lines)
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def day05(scale, rng):
+    '''
+    Almanac - scale multiplies both the number of seed ranges (10 per unit) and
+    the number of ranges in each of the seven maps (30 per unit)
+    '''
+    top = 2**32
+    names = ['seed', 'soil', 'fertilizer', 'water', 'light', 'temperature', 'humidity', 'location']
+
+    seeds = []
+    for _ in range(10 * scale):
+        seeds += [rng.randrange(top - 2**28), rng.randint(1, 2**28)]
+    lines = ['seeds: ' + ' '.join(str(x) for x in seeds)]
+
+    for i in range(len(names) - 1):
+        lines += ['', f'{names[i]}-to-{names[i+1]} map:']
+
+        # Split the number line into non-overlapping source ranges and send each somewhere
+        cuts = sorted(rng.sample(range(1, top), 30 * scale))
+        ranges = []
+        for start, end in zip([0] + cuts, cuts + [top]):
+            if rng.random() < 0.9:
+                ranges.append(f'{rng.randrange(top - (end - start) + 1)} {start} {end - start}')
+        rng.shuffle(ranges)
+        lines += ranges
+
+    return '\n'.join(lines)
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def day06(scale, rng):
+    '''
+    Boat races - scale multiplies the race times (and so the work in part 1).
+    Times are capped so that the concatenated part 2 numbers stay within what
+    the existing float-based binary search handles exactly.
+    '''
+    lo = min(40 * scale, 4000)
+    hi = min(99 * scale, 8999)
+
+    while True:
+        times = [rng.randint(lo, hi) for _ in range(4)]
+        distances = []
+        for time in times:
+            hold = rng.randint(time // 10, time // 2)
+            distances.append(hold * (time - hold))
+
+        # Make sure part 2 (the concatenated race) is also winnable
+        total_time = int(''.join(str(x) for x in times))
+        total_distance = int(''.join(str(x) for x in distances))
+        if total_distance < (total_time // 2) * (total_time - total_time // 2):
+            break
+
+    return '\n'.join([
+        'Time:     ' + ' '.join(f'{x:>6}' for x in times),
+        'Distance: ' + ' '.join(f'{x:>6}' for x in distances),
+    ])
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def day07(scale, rng):
+    '''
+    Camel cards - scale is the number of hands (1000 per unit)
+    '''
+    lines = []
+    for _ in range(1000 * scale):
+        hand = ''.join(rng.choice('AKQJT98765432') for _ in range(5))
+        lines.append(f'{hand} {rng.randint(1, 1000)}')
+
+    return '\n'.join(lines)
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def day08(scale, rng):
+    '''
+    Haunted wasteland network - scale multiplies the number of nodes (~750 per
+    unit). The network is six chains, one of them AAA -> ... -> ZZZ, whose forks
+    both lead onward so every start reaches its Z node whatever the instructions.
+    '''
+    numChains = 6
+    lengths = [rng.randint(100 * scale, 150 * scale) for _ in range(numChains)]
+
+    # Internal node names can't end in 'A' or 'Z', start/end names must
+    middle = string.ascii_uppercase[1:-1]
+    length = 3
+    while 26 ** (length - 1) * len(middle) < 4 * sum(lengths):
+        length += 1
+    internal = set()
+    while len(internal) < sum(lengths):
+        internal.add(''.join(rng.choice(string.ascii_uppercase) for _ in range(length - 1)) + rng.choice(middle))
+    internal = list(internal)
+
+    lines = []
+    ends = ['AAA', 'ZZZ'] + __names(rng, 2 * (numChains - 1), 2, string.ascii_uppercase, reserved={'AA', 'ZZ'})
+    for c in range(numChains):
+        start, end = (ends[0], ends[1]) if c == 0 else (ends[2*c] + 'A', ends[2*c + 1] + 'Z')
+        chain = [start] + internal[sum(lengths[:c]):sum(lengths[:c+1])] + [end]
+        for i in range(len(chain) - 1):
+            lines.append(f'{chain[i]} = ({chain[i+1]}, {chain[i+1]})')
+        lines.append(f'{end} = ({chain[1]}, {chain[1]})')
+    rng.shuffle(lines)
+
+    instructions = ''.join(rng.choice('LR') for _ in range(263))
+    return '\n'.join([instructions, ''] + lines)
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def day09(scale, rng):
+    '''
+    OASIS report - scale is the number of histories (200 per unit), each one a
+    random polynomial sampled at 21 points
+    '''
+    lines = []
+    for _ in range(200 * scale):
+        coeffs = [rng.randint(-9, 9) for _ in range(rng.randint(1, 8))]
+        values = [sum(c * x**p for p, c in enumerate(coeffs)) for x in range(21)]
+        lines.append(' '.join(str(v) for v in values))
+
+    return '\n'.join(lines)
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def day10(scale, rng):
+    '''
+    Pipe maze - square grid of 140x140 cells per unit holding one long loop with
+    S at its bottom-left corner
+    '''
+    side = __side(140, scale)
+
+    # Get the loop as a list of cells from our list of moves
+    dirs = {'R': (0, +1), 'L': (0, -1), 'U': (-1, 0), 'D': (+1, 0)}
+    while True:
+        moves = __teeth(rng, max(1, side // 10), 4, side - 1)
+        if sum(length for dir, length in moves if dir == 'L') <= side - 1:
+            break
+    cells = [(0, 0)]
+    for dir, length in moves:
+        for _ in range(length):
+            cells.append((cells[-1][0] + dirs[dir][0], cells[-1][1] + dirs[dir][1]))
+    cells = cells[:-1]
+
+    # Rotate the loop so that it starts (S) at the bottom-left corner, then draw it
+    first = cells.index((side - 1, 0))
+    cells = cells[first:] + cells[:first]
+    grid = [['.'] * side for _ in range(side)]
+    for i, cell in enumerate(cells):
+        grid[cell[0]][cell[1]] = __pipe(cells[i-1], cell, cells[(i+1) % len(cells)])
+    grid[side-1][0] = 'S'
+
+    return '\n'.join(''.join(row) for row in grid)
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def day11(scale, rng):
+    '''
+    Galaxy image - square grid of 140x140 cells per unit with ~2% galaxies and
+    some empty rows/columns
+    '''
+    side = __side(140, scale)
+    empty_rows = set(rng.sample(range(side), side // 10))
+    empty_cols = set(rng.sample(range(side), side // 10))
+
+    lines = []
+    for i in range(side):
+        row = ''
+        for j in range(side):
+            if i not in empty_rows and j not in empty_cols and rng.random() < 0.025:
+                row += '#'
+            else:
+                row += '.'
+        lines.append(row)
+
+    return '\n'.join(lines)
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def day12(scale, rng):
+    '''
+    Spring records - scale is the number of rows (1000 per unit). Each row is a
+    real arrangement with some of its springs hidden behind '?'s.
+    '''
+    lines = []
+    for _ in range(1000 * scale):
+        groups = [rng.randint(1, 5) for _ in range(rng.randint(1, 6))]
+        springs = '.' * rng.randint(0, 2)
+        for group in groups:
+            springs += '#' * group + '.' * rng.randint(1, 3)
+        springs = ''.join('?' if rng.random() < 0.5 else ch for ch in springs)
+        lines.append(springs + ' ' + ','.join(str(x) for x in groups))
+
+    return '\n'.join(lines)
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def __mirror_fold(k, line, extent):
+    '''
+    Helper function for Day 13 - map an index onto its reflection about "line" if
+    it lies on the far side of the mirror, otherwise leave it alone
+    '''
+    if line < k <= line + extent:
+        return 2*line + 1 - k
+    return k
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def day13(scale, rng):
+    '''
+    Mirror patterns - scale is the number of patterns (100 per unit). Each one is
+    symmetric about a row (part 1) and symmetric about a column except for one
+    "smudge" that leaves the row mirror untouched (part 2).
+    '''
+    patterns = []
+    for _ in range(100 * scale):
+
+        # Pick a row mirror that doesn't cover every row, and any column mirror
+        while True:
+            m, n = rng.randint(5, 17), rng.randint(5, 17)
+            row = rng.randint(0, m - 2)
+            row_extent = min(row + 1, m - row - 1)
+            if row_extent < max(row + 1, m - row - 1):
+                break
+        col = rng.randint(0, n - 2)
+        col_extent = min(col + 1, n - col - 1)
+
+        base = [[rng.choice('#.') for _ in range(n)] for _ in range(m)]
+        grid = [[base[__mirror_fold(i, row, row_extent)][__mirror_fold(j, col, col_extent)] for j in range(n)] for i in range(m)]
+
+        # Smudge one cell outside of the row mirror but inside the column mirror
+        i = rng.choice([k for k in range(m) if not (row - row_extent < k <= row + row_extent)])
+        j = rng.randint(col - col_extent + 1, col + col_extent)
+        grid[i][j] = '#' if grid[i][j] == '.' else '.'
+
+        patterns.append('\n'.join(''.join(x) for x in grid))
+
+    return '\n\n'.join(patterns)
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def day14(scale, rng):
+    '''
+    Reflector dish - square grid of 100x100 cells per unit
+    '''
+    side = __side(100, scale)
+    lines = []
+    for _ in range(side):
+        lines.append(''.join(rng.choices('O#.', weights=[20, 15, 65], k=side)))
+
+    return '\n'.join(lines)
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def day15(scale, rng):
+    '''
+    Initialization sequence - scale is the number of steps (4000 per unit)
+    '''
+    labels = __names(rng, 500 * scale, length=None)
+    steps = []
+    for _ in range(4000 * scale):
+        label = rng.choice(labels)
+        steps.append(f'{label}={rng.randint(1, 9)}' if rng.random() < 0.6 else f'{label}-')
+
+    return ','.join(steps)
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def day16(scale, rng):
+    '''
+    Mirror contraption - square grid of 110x110 cells per unit
+    '''
+    side = __side(110, scale)
+    lines = []
+    for _ in range(side):
+        lines.append(''.join(rng.choices('./\\|-', weights=[90, 2.5, 2.5, 2.5, 2.5], k=side)))
+
+    return '\n'.join(lines)
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def day17(scale, rng):
+    '''
+    Heat loss map - square grid of 141x141 digits per unit
+    '''
+    side = __side(141, scale)
+    return '\n'.join(''.join(rng.choices('123456789', k=side)) for _ in range(side))
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def day18(scale, rng):
+    '''
+    Dig plan - scale is the number of instructions (~600 per unit). Part 1 and
+    part 2 (the hex "colors") each describe their own closed loop, with the same
+    number of moves so they fit on the same lines.
+    '''
+    numTeeth = 150 * scale
+    small = __teeth(rng, numTeeth, 8, 40)
+    large = __teeth(rng, numTeeth, 800000, 8000000)
+
+    lines = []
+    hex_dirs = {'R': '0', 'D': '1', 'L': '2', 'U': '3'}
+    for (dir, length), (hex_dir, hex_length) in zip(small, large):
+        lines.append(f'{dir} {length} (#{hex_length:05x}{hex_dirs[hex_dir]})')
+
+    return '\n'.join(lines)
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def day19(scale, rng):
+    '''
+    Workflows and parts - scale multiplies the number of workflows (~550 per
+    unit) and parts (200 per unit). Workflows form a tree rooted at "in".
+    '''
+    numWorkflows = 550 * scale
+    names = __names(rng, numWorkflows - 1, reserved={'in'})
+
+    # Grow a tree of workflows, each one sending parts either to A/R or to a child
+    lines = []
+    pending = ['in']
+    while pending:
+        name = pending.pop(0)
+        targets = []
+        for _ in range(rng.randint(2, 4)):
+            if names and rng.random() < 0.6:
+                targets.append(names.pop())
+                pending.append(targets[-1])
+            else:
+                targets.append(rng.choice('AR'))
+
+        conditions = [f'{rng.choice("xmas")}{rng.choice("<>")}{rng.randint(1, 4000)}:{target}' for target in targets[:-1]]
+        lines.append(f'{name}{{{",".join(conditions + [targets[-1]])}}}')
+    rng.shuffle(lines)
+
+    lines.append('')
+    for _ in range(200 * scale):
+        lines.append('{' + ','.join(f'{letter}={rng.randint(1, 4000)}' for letter in 'xmas') + '}')
+
+    return '\n'.join(lines)
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def day20(scale, rng):
+    '''
+    Pulse modules - scale multiplies the number of 12-bit counter branches (4 per
+    unit). Each branch is a chain of flip-flops with a conjunction that resets it
+    when it reaches a prime, feeding one conjunction that feeds "rx".
+    '''
+    numBranches = 4 * scale
+    primes = [p for p in range(3001, 4096, 2) if all(p % d for d in range(3, int(p**0.5) + 1, 2))]
+    names = __names(rng, numBranches * 14 + 1, reserved={'rx', 'broadcaster'})
+    final = names.pop()
+
+    lines = []
+    starts = []
+    for _ in range(numBranches):
+        flips = [names.pop() for _ in range(12)]
+        conj, inverter = names.pop(), names.pop()
+        target = rng.choice(primes)
+        starts.append(flips[0])
+
+        conj_outs = [flips[0], inverter]
+        for i, flip in enumerate(flips):
+            outs = [flips[i+1]] if i < 11 else []
+            if target >> i & 1:
+                outs.append(conj)
+            elif i > 0:
+                conj_outs.append(flip)
+            rng.shuffle(outs)
+            lines.append(f'%{flip} -> {", ".join(outs)}')
+        lines.append(f'&{conj} -> {", ".join(conj_outs)}')
+        lines.append(f'&{inverter} -> {final}')
+
+    lines.append(f'&{final} -> rx')
+    lines.append(f'broadcaster -> {", ".join(starts)}')
+    rng.shuffle(lines)
+
+    return '\n'.join(lines)
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def day21(scale, rng):
+    '''
+    Garden map - square grid of 131x131 cells per unit. Like the real input, S
+    sits in the middle, the middle row/column and the border are clear, and there
+    is a clear diamond between the edge midpoints. Any pockets of garden that S
+    can't reach are filled in with rocks.
+    '''
+    side = __side(131, scale, odd=True)
+    mid = side // 2
+
+    grid = [['.'] * side for _ in range(side)]
+    for i in range(1, side - 1):
+        for j in range(1, side - 1):
+            if i == mid or j == mid or abs(abs(i - mid) + abs(j - mid) - mid) <= 1:
+                continue
+            if rng.random() < 0.12:
+                grid[i][j] = '#'
+
+    # Fill in any pockets we can't get to from S
+    seen = {(mid, mid)}
+    stack = [(mid, mid)]
+    while stack:
+        i, j = stack.pop()
+        for di, dj in [(0, +1), (-1, 0), (0, -1), (+1, 0)]:
+            neigh = (i + di, j + dj)
+            if 0 <= neigh[0] < side and 0 <= neigh[1] < side and neigh not in seen and grid[neigh[0]][neigh[1]] == '.':
+                seen.add(neigh)
+                stack.append(neigh)
+    for i in range(side):
+        for j in range(side):
+            if (i, j) not in seen:
+                grid[i][j] = '#'
+    grid[mid][mid] = 'S'
+
+    return '\n'.join(''.join(row) for row in grid)
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def day22(scale, rng):
+    '''
+    Falling bricks - scale is the number of bricks (1250 per unit) dropped into
+    a 10x10 footprint
+    '''
+    numBricks = 1250 * scale
+    height = numBricks // 4
+    filled = set()
+
+    lines = []
+    while len(lines) < numBricks:
+        start = [rng.randint(0, 9), rng.randint(0, 9), rng.randint(1, height)]
+        axis = rng.choice([0, 0, 1, 1, 2])
+        end = list(start)
+        end[axis] += rng.randint(0, 4)
+        if end[0] > 9 or end[1] > 9:
+            continue
+
+        cubes = set()
+        for i in range(start[0], end[0] + 1):
+            for j in range(start[1], end[1] + 1):
+                for k in range(start[2], end[2] + 1):
+                    cubes.add((i, j, k))
+        if cubes & filled:
+            continue
+
+        filled |= cubes
+        lines.append(f'{start[0]},{start[1]},{start[2]}~{end[0]},{end[1]},{end[2]}')
+
+    return '\n'.join(lines)
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def day23(scale, rng):
+    '''
+    Hiking trails - a 6x6 lattice of junctions joined by corridors, with slopes
+    leading out of and into every junction so the part 1 trails only ever run
+    right or down. Scale grows the corridors so the number of cells scales.
+    '''
+    numJunctions = 6
+    spacing = __side(28, scale)
+    side = spacing * (numJunctions - 1) + 3
+
+    grid = [['#'] * side for _ in range(side)]
+    grid[0][1] = '.'
+    grid[side-1][side-2] = '.'
+    for a in range(numJunctions):
+        for b in range(numJunctions):
+            row, col = 1 + a*spacing, 1 + b*spacing
+            grid[row][col] = '.'
+
+            # Corridor to the junction on the right
+            if b < numJunctions - 1:
+                for j in range(col + 1, col + spacing):
+                    grid[row][j] = '>' if j in (col + 1, col + spacing - 1) else '.'
+
+            # Corridor to the junction below
+            if a < numJunctions - 1:
+                for i in range(row + 1, row + spacing):
+                    grid[i][col] = 'v' if i in (row + 1, row + spacing - 1) else '.'
+
+    return '\n'.join(''.join(row) for row in grid)
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def day24(scale, rng):
+    '''
+    Hailstones - scale is the number of hailstones (300 per unit). A rock is
+    picked first and every hailstone is placed so that the rock hits it.
+    '''
+    rock_pos = [rng.randint(2 * 10**14, 4 * 10**14) for _ in range(3)]
+    rock_vel = [rng.randint(-300, 300) for _ in range(3)]
+
+    lines = []
+    times = rng.sample(range(10**11, 10**12), 300 * scale)
+    for time in times:
+        while True:
+            vel = [rng.randint(-900, 900) for _ in range(3)]
+            if vel[0] != 0 and vel[0] != rock_vel[0]:
+                break
+        pos = [rock_pos[k] + time * (rock_vel[k] - vel[k]) for k in range(3)]
+        lines.append(f'{pos[0]}, {pos[1]}, {pos[2]} @ {vel[0]}, {vel[1]}, {vel[2]}')
+
+    return '\n'.join(lines)
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def day25(scale, rng):
+    '''
+    Component wiring - scale is the number of components (1500 per unit), split
+    into two well-connected halves joined by exactly three wires
+    '''
+    numNodes = 1500 * scale
+    names = __names(rng, numNodes)
+    halves = [names[:numNodes // 2], names[numNodes // 2:]]
+
+    # Each half is a random spanning tree plus a few extra wires per component
+    edges = set()
+    for half in halves:
+        for i in range(1, len(half)):
+            edges.add((half[i], half[rng.randrange(i)]))
+        for _ in range(len(half)):
+            a, b = rng.sample(half, 2)
+            if (b, a) not in edges:
+                edges.add((a, b))
+    for _ in range(3):
+        edges.add((rng.choice(halves[0]), rng.choice(halves[1])))
+
+    # Group the wires by one of their endpoints, one line per component
+    lines = {}
+    for a, b in edges:
+        if rng.random() < 0.5:
+            a, b = b, a
+        lines.setdefault(a, []).append(b)
+
+    return '\n'.join(f'{k}: {" ".join(v)}' for k, v in lines.items())
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+GENERATORS = {
+    1: day01,   2: day02,   3: day03,   4: day04,   5: day05,
+    6: day06,   7: day07,   8: day08,   9: day09,  10: day10,
+   11: day11,  12: day12,  13: day13,  14: day14,  15: day15,
+   16: day16,  17: day17,  18: day18,  19: day19,  20: day20,
+   21: day21,  22: day22,  23: day23,  24: day24,  25: day25,
+}
@@ -0,0 +1,150 @@
+'''
+    What: Advent of Code 2023 - dense character grid shared by the grid days
+    Who: Josh Geiser
+
+    A Grid holds a puzzle map as an (m, n) uint8 array of its characters. On top
+    of that it gives us:
+        - boolean masks of any set of characters (walls and open cells up front)
+        - cached lookups of where a character (e.g. the start 'S') is
+        - flat indices (k = i*n + j) with a precomputed neighbor table, so the
+          BFS-style loops can work on plain ints instead of (row, col) tuples
+'''
+
+from aoc.lazy import lazy_import
+
+# Deferred so that days importing Grid only pay for NumPy once they build one
+np = lazy_import('numpy')
+
+# Neighbor directions in the order the days already use: east, north, west, south
+DIRS = [(0, +1), (-1, 0), (0, -1), (+1, 0)]
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+class Grid:
+    '''
+    Dense character grid backed by a uint8 NumPy array
+    '''
+
+    def __init__(self, data, wall='#'):
+        self.data = data
+        self.m, self.n = data.shape
+        self.size = self.m * self.n
+
+        # Precomputed masks of blocked and open cells
+        self.wall = self.mask(wall)
+        self.open = ~self.wall
+
+        self._found = {}
+        self._neighbors = None
+
+    @classmethod
+    def from_lines(cls, lines, wall='#'):
+        '''
+        Build a grid from a list of equal-length strings
+        '''
+        buf = ''.join(lines).encode('ascii')
+        data = np.frombuffer(buf, dtype=np.uint8).reshape(len(lines), -1)
+        return cls(data, wall)
+
+    @property
+    def shape(self):
+        return (self.m, self.n)
+
+    #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+    def mask(self, chars):
+        '''
+        Boolean (m, n) array that is True wherever the grid holds one of "chars"
+        '''
+        codes = np.frombuffer(chars.encode('ascii'), dtype=np.uint8)
+        if len(codes) == 1:
+            return self.data == codes[0]
+        return np.isin(self.data, codes)
+
+    def find_all(self, char):
+        '''
+        Every (row, col) holding "char", in row-major order
+        '''
+        return [(int(i), int(j)) for i, j in np.argwhere(self.mask(char))]
+
+    def find(self, char):
+        '''
+        First (row, col) holding "char", or None. Cached, so days can ask for
+        their start cell as often as they like.
+        '''
+        if char not in self._found:
+            ks = np.flatnonzero(self.mask(char))
+            self._found[char] = self.coords(int(ks[0])) if len(ks) > 0 else None
+        return self._found[char]
+
+    @property
+    def start(self):
+        return self.find('S')
+
+    #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+    def index(self, i, j):
+        '''
+        Flat index of (row, col)
+        '''
+        return i * self.n + j
+
+    def coords(self, k):
+        '''
+        (row, col) of flat index k
+        '''
+        return divmod(k, self.n)
+
+    @property
+    def neighbors(self):
+        '''
+        (m*n, 4) array of the flat index of each cell's neighbor in each of the
+        DIRS directions, -1 where that neighbor is off the grid
+        '''
+        if self._neighbors is None:
+            rows, cols = np.divmod(np.arange(self.size), self.n)
+            table = np.full((self.size, len(DIRS)), -1, dtype=np.int64)
+            for d, (di, dj) in enumerate(DIRS):
+                r, c = rows + di, cols + dj
+                valid = (0 <= r) & (r < self.m) & (0 <= c) & (c < self.n)
+                table[valid, d] = r[valid] * self.n + c[valid]
+            self._neighbors = table
+        return self._neighbors
+
+    def adjacency(self, mask=None):
+        '''
+        For every cell, the list of flat indices of its in-grid neighbors that are
+        in "mask" (default: open cells). "mask" can also be a list with one mask
+        per DIRS direction, for grids where what we can step onto depends on the
+        direction we step in. Plain Python lists, for the hot loops.
+        '''
+        if mask is None:
+            mask = self.open
+        masks = mask if isinstance(mask, (list, tuple)) else [mask] * len(DIRS)
+
+        # Index each mask with the neighbor table (the extra False catches the -1s)
+        table = self.neighbors
+        ok = np.stack([np.append(mk.ravel(), False)[table[:, d]] for d, mk in enumerate(masks)], axis=1)
+        return [[k for k in row if k >= 0] for row in np.where(ok, table, -1).tolist()]
+
+    def shift(self, arr, di, dj, fill=False):
+        '''
+        Shift an (m, n) array so that out[i, j] = arr[i - di, j - dj], filling the
+        cells that come in from off the grid with "fill"
+        '''
+        out = np.full_like(arr, fill)
+        src_i = slice(max(-di, 0), self.m - max(di, 0))
+        dst_i = slice(max(di, 0), self.m - max(-di, 0))
+        src_j = slice(max(-dj, 0), self.n - max(dj, 0))
+        dst_j = slice(max(dj, 0), self.n - max(-dj, 0))
+        out[dst_i, dst_j] = arr[src_i, src_j]
+        return out
+
+    def dilate(self, mask, diagonal=True):
+        '''
+        Grow a boolean mask by one cell in every direction (including the
+        diagonals unless told otherwise)
+        '''
+        out = mask.copy()
+        steps = [(di, dj) for di in (-1, 0, 1) for dj in (-1, 0, 1) if (di, dj) != (0, 0)]
+        for di, dj in steps:
+            if diagonal or di == 0 or dj == 0:
+                out |= self.shift(mask, di, dj)
+        return out
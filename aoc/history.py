@@ -0,0 +1,120 @@
+'''
+    What: Advent of Code 2023 - timing history and a slowdown gate for the runner
+    Who: Josh Geiser
+
+    Every recorded run of a (day, part) adds a row to a small SQLite database.
+    Before recording, each new time is compared against the rolling median of
+    that part's previous runs on the same input with the same engine, and
+    anything that got slower than "threshold" times that median is reported as
+    a regression. The same medians tell the runner which engine is fastest.
+'''
+
+import sqlite3
+import statistics
+import time
+from pathlib import Path
+
+# Where the timing history lives
+HISTORY_DB = Path(__file__).resolve().parents[1] / '.aoc_history.sqlite'
+
+# Ignore slowdowns smaller than this many seconds, whatever the ratio - the fast
+# days run in a millisecond or two and are all noise
+MIN_SLOWDOWN = 0.05
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def connect(path=HISTORY_DB):
+    '''
+    Open (and if needed create) the history database
+    '''
+    db = sqlite3.connect(path)
+    db.execute('''
+        CREATE TABLE IF NOT EXISTS runs (
+            id        INTEGER PRIMARY KEY,
+            timestamp REAL NOT NULL,
+            day       INTEGER NOT NULL,
+            part      INTEGER NOT NULL,
+            input     TEXT NOT NULL,
+            time      REAL NOT NULL,
+            engine    TEXT NOT NULL DEFAULT 'reference'
+        )
+    ''')
+
+    # Histories from before there were engines only ever timed the reference
+    columns = [row[1] for row in db.execute('PRAGMA table_info(runs)')]
+    if 'engine' not in columns:
+        db.execute("ALTER TABLE runs ADD COLUMN engine TEXT NOT NULL DEFAULT 'reference'")
+
+    db.execute('CREATE INDEX IF NOT EXISTS runs_by_engine ON runs (day, part, input, engine, id)')
+    return db
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def __timed(results):
+    '''
+    Helper function - the results that actually timed a fresh run (not cached,
+    not failed, not slowed down by the profilers or tracemalloc)
+    '''
+    for (day, part), result in sorted(results.items()):
+        if result['time'] is None or result.get('cached') or result.get('error') or 'profile' in result or 'memory' in result:
+            continue
+        yield day, part, result.get('engine', 'reference'), result['time']
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def rolling_median(db, day, part, input_name, window, engine='reference'):
+    '''
+    Median time of the last "window" recorded runs of a part with an engine
+    (None if no history)
+    '''
+    rows = db.execute(
+        'SELECT time FROM runs WHERE day = ? AND part = ? AND input = ? AND engine = ? ORDER BY id DESC LIMIT ?',
+        (day, part, input_name, engine, window),
+    ).fetchall()
+    if not rows:
+        return None
+    return statistics.median(row[0] for row in rows)
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def find_regressions(db, results, input_name, window=10, threshold=1.5):
+    '''
+    Compare this run's times against their rolling medians. Returns a list of
+    (day, part, engine, time, median) for every part that got more than
+    "threshold" times slower.
+    '''
+
+    regressions = []
+    for day, part, engine, elapsed in __timed(results):
+        median = rolling_median(db, day, part, input_name, window, engine)
+        if median is None:
+            continue
+        if elapsed > threshold * median and elapsed - median > MIN_SLOWDOWN:
+            regressions.append((day, part, engine, elapsed, median))
+
+    return regressions
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def record(db, results, input_name):
+    '''
+    Add this run's times to the history
+    '''
+
+    now = time.time()
+    rows = [(now, day, part, input_name, elapsed, engine) for day, part, engine, elapsed in __timed(results)]
+    with db:
+        db.executemany('INSERT INTO runs (timestamp, day, part, input, time, engine) VALUES (?, ?, ?, ?, ?, ?)', rows)
+
+    return len(rows)
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def print_regressions(regressions, threshold):
+    '''
+    Report the parts that got slower
+    '''
+
+    if not regressions:
+        print(f'No regressions (threshold {threshold:g}x the rolling median)')
+        return
+
+    print(f'Regressions (slower than {threshold:g}x the rolling median):')
+    for day, part, engine, elapsed, median in regressions:
+        print(f'  Day {day:>2} part {part} ({engine}): {elapsed:.3f} s vs median {median:.3f} s ({elapsed / median:.2f}x)')
+
+    return
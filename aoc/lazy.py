@@ -0,0 +1,37 @@
+'''
+    What: Advent of Code 2023 - deferred imports for the heavy dependencies
+    Who: Josh Geiser
+
+    NumPy alone takes ~150 ms to import, which is far longer than most days take
+    to run. lazy_import() hands back a module object straight away and only
+    really imports it the first time one of its attributes is used, so a day
+    (or a shared helper) that only needs NumPy on one code path only pays for it
+    on that path.
+'''
+
+import importlib.util
+import sys
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def lazy_import(name):
+    '''
+    Get a module that is only loaded on first attribute access. Only use this for
+    top-level packages (e.g. 'numpy'); finding a submodule like 'scipy.optimize'
+    imports its parent package right away, so import those inside the function
+    that needs them instead.
+    '''
+
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f'No module named {name!r}', name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+
+    return module
@@ -0,0 +1,110 @@
+'''
+    What: Advent of Code 2023 - shared input loading for every day
+    Who: Josh Geiser
+
+    Three ways to get at an input file, from cheapest to most convenient:
+        read_bytes(infile)  - the raw file contents, memory-mapped
+        LineIndex(infile)   - the mapped file plus the offset of every line, so
+                              single rows can be pulled out without copying
+        iter_lines(source)  - stripped lines, one at a time (works on stdin too)
+    and read_lines(infile), the stripped list of lines every day used to build
+    for itself with f.readlines().
+'''
+
+import mmap
+from array import array
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def read_bytes(infile):
+    '''
+    Memory-map an input file read-only. Returns a bytes-like object (an mmap, or
+    b'' for an empty file since those can't be mapped).
+    '''
+
+    with open(infile, 'rb') as f:
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return b''
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+class LineIndex:
+    '''
+    A memory-mapped input file with the start offset of every line. Rows come
+    back as memoryviews into the map (row) or as stripped strings (indexing).
+    '''
+
+    def __init__(self, infile):
+        self.buf = read_bytes(infile)
+
+        # Offsets of the start of every line. The last entry is one past the end
+        # of the final line's newline (real or not) so row i always ends at
+        # offsets[i+1] - 1.
+        self.offsets = array('q', [0])
+        pos = self.buf.find(b'\n')
+        while pos != -1:
+            self.offsets.append(pos + 1)
+            pos = self.buf.find(b'\n', pos + 1)
+        if len(self.buf) > 0 and self.offsets[-1] != len(self.buf):
+            self.offsets.append(len(self.buf) + 1)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def row(self, i):
+        '''
+        Zero-copy view of row i, without its line ending
+        '''
+        if i < 0:
+            i += len(self)
+        start, end = self.offsets[i], self.offsets[i+1] - 1
+        view = memoryview(self.buf)[start:end]
+        if len(view) > 0 and view[-1] == ord('\r'):
+            view = view[:-1]
+        return view
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[k] for k in range(*i.indices(len(self)))]
+        if not -len(self) <= i < len(self):
+            raise IndexError('line index out of range')
+        return str(self.row(i), 'utf-8').strip()
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def iter_lines(source):
+    '''
+    Lazily yield the stripped lines of a file. "source" is either a path or an
+    already open text file (e.g. sys.stdin).
+    '''
+
+    if hasattr(source, 'read'):
+        for line in source:
+            yield line.strip()
+        return
+
+    with open(source, 'r') as f:
+        for line in f:
+            yield line.strip()
+
+    return
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def read_lines(infile):
+    '''
+    Read a whole input file as a list of stripped lines. The file is decoded in
+    one go and split once, rather than going through f.readlines().
+    '''
+
+    text = str(read_bytes(infile), 'utf-8')
+    if len(text) == 0:
+        return []
+
+    lines = text.split('\n')
+    if text.endswith('\n'):
+        lines.pop()
+
+    return [line.strip() for line in lines]
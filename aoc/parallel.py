@@ -0,0 +1,72 @@
+'''
+    What: Advent of Code 2023 - split per-line work across a process pool
+    Who: Josh Geiser
+
+    For days where every input line contributes independently to the answer,
+    chunked_sum() cuts the lines into chunks, has a pool of worker processes
+    fold each chunk, and adds up the partial results. The function that folds a
+    chunk is usually just the day's own task (they already sum over whatever
+    lines they're given), so a parallel version of a task is a one-liner.
+'''
+
+import os
+from itertools import islice
+
+# Chunk size to use when we can't tell how many lines there are (e.g. stdin)
+DEFAULT_CHUNK_SIZE = 1000
+
+# Roughly how many chunks each worker gets when we know the number of lines -
+# more than one so a few slow chunks don't leave the other workers idle
+CHUNKS_PER_WORKER = 4
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def __chunks(lines, chunk_size):
+    '''
+    Helper function - yield lists of up to chunk_size lines from any iterable
+    '''
+    lines = iter(lines)
+    chunk = list(islice(lines, chunk_size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(lines, chunk_size))
+    return
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def chunked_sum(func, lines, workers=None, chunk_size=None):
+    '''
+    Sum func(chunk) over chunks of "lines" using a pool of worker processes.
+    "func" has to be a module-level function (so it can be pickled). Only a
+    couple of chunks per worker are in flight at once, so "lines" can be a lazy
+    iterator over a huge input without it all ending up in memory.
+    '''
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunk_size is None:
+        if hasattr(lines, '__len__'):
+            chunk_size = max(1, -(-len(lines) // (workers * CHUNKS_PER_WORKER)))
+        else:
+            chunk_size = DEFAULT_CHUNK_SIZE
+
+    # Not worth starting a pool for a single worker
+    if workers == 1:
+        return sum(func(chunk) for chunk in __chunks(lines, chunk_size))
+
+    # Pulls in multiprocessing (~40 ms), so only pay for it once we need a pool
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+    total = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        for chunk in __chunks(lines, chunk_size):
+
+            # Wait for something to finish before handing out too much work
+            if len(pending) >= 2 * workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                total += sum(future.result() for future in done)
+
+            pending.add(pool.submit(func, chunk))
+
+        total += sum(future.result() for future in wait(pending)[0])
+
+    return total
@@ -0,0 +1,87 @@
+'''
+    What: Advent of Code 2023 - shared helpers for pulling numbers out of inputs
+    Who: Josh Geiser
+
+    Most days get at their numbers through chains of split()/replace() and int().
+    These helpers grab every signed integer (or every word) in a single pass
+    instead. They work on str or bytes, so they can run straight over the
+    memory-mapped input from aoc.loader. The array versions convert everything
+    in one go with NumPy rather than calling int() per number (about twice as
+    fast as a regex findall plus int() on a big input).
+'''
+
+import re
+
+from aoc.lazy import lazy_import
+
+np = lazy_import('numpy')
+
+# Signed integers and "words" (runs of letters/digits/underscores)
+INT_RE = re.compile(r'-?\d+')
+INT_RE_BYTES = re.compile(rb'-?\d+')
+WORD_RE = re.compile(r'\w+')
+STRAY_MINUS_RE = re.compile(rb'-(?!\d)')
+
+# An int64 holds every number up to 18 digits long, so only longer ones might not
+# fit (NumPy saturates those at the int64 limits rather than failing)
+LONG_INT_RE = re.compile(rb'-?\d{19,}')
+
+# Byte translation table keeping digits and minus signs, blanking everything else
+__NUMBER_BYTES = bytes(c if c in b'0123456789-' else ord(' ') for c in range(256))
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def ints(line):
+    '''
+    Every signed integer in a str (or bytes) line, as a list of Python ints
+    '''
+    pattern = INT_RE_BYTES if isinstance(line, (bytes, bytearray)) else INT_RE
+    return [int(x) for x in pattern.findall(line)]
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def words(line):
+    '''
+    Every run of word characters in a line - e.g. the node names out of Day 8's
+    "AAA = (BBB, CCC)"
+    '''
+    return WORD_RE.findall(line)
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def int_array(buf):
+    '''
+    Every signed integer in a whole buffer (str, bytes or an mmap), in order, as
+    a 1-d int64 NumPy array. Rather than converting number by number, blank out
+    everything that can't be part of a number in one translate() and let NumPy
+    parse the lot. Raises OverflowError for numbers that don't fit in an int64
+    (use ints() for those, Python ints don't overflow).
+    '''
+
+    if isinstance(buf, str):
+        buf = buf.encode('ascii')
+    buf = bytes(buf).translate(__NUMBER_BYTES)
+
+    # Minus signs that aren't followed by a digit (e.g. "seed-to-soil") aren't
+    # signs, and ones that are need a separator in front (e.g. "1-2" is 1, -2)
+    if b'-' in buf:
+        buf = STRAY_MINUS_RE.sub(b' ', buf).replace(b'-', b' -')
+
+    if not buf.strip():
+        return np.zeros(0, dtype=np.int64)
+
+    for number in LONG_INT_RE.findall(buf):
+        if not -2**63 <= int(number) < 2**63:
+            raise OverflowError('int_array only handles numbers that fit in an int64')
+
+    return np.fromstring(buf, dtype=np.int64, sep=' ')
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def int_matrix(lines):
+    '''
+    The signed integers of a list of lines as a 2-d array with one row per line.
+    Every line has to hold the same number of integers.
+    '''
+    values = int_array('\n'.join(lines))
+    if len(lines) == 0:
+        return values.reshape(0, 0)
+    if len(values) % len(lines) != 0:
+        raise ValueError('int_matrix needs the same number of integers on every line')
+    return values.reshape(len(lines), -1)
@@ -0,0 +1,284 @@
+'''
+    What: Advent of Code 2023 - opt-in profiling of individual tasks
+    Who: Josh Geiser
+
+    profile_call() runs a task under cProfile and, where the platform has
+    setitimer, a stack-sampling profiler at the same time. For each task it writes:
+        <name>.pstats     - cProfile stats (python -m pstats, snakeviz, ...)
+        <name>.collapsed  - sampled stacks in the "collapsed" format that
+                            flamegraph.pl / speedscope / inferno read
+    and hands back the top functions by cumulative time.
+
+    trace_memory() runs a task under tracemalloc instead, to see how much memory
+    it needs at its peak and which lines allocate the most.
+
+    import_time() measures how long a day takes to import in a fresh interpreter
+    (python -X importtime), to keep cold starts for the light days cheap.
+'''
+
+import cProfile
+import os
+import pstats
+import signal
+import subprocess
+import sys
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+
+# How often the sampling profiler looks at the stack (seconds of CPU time)
+SAMPLE_INTERVAL = 0.001
+
+# How many functions to report
+TOP_N = 10
+
+# Cold-start import budget for a single day (milliseconds)
+IMPORT_BUDGET_MS = 50
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+class StackSampler:
+    '''
+    Minimal signal-based sampling profiler. Every SAMPLE_INTERVAL of CPU time we
+    record the Python stack from just below "root" down to the running frame
+    (leaving out cProfile's own runcall frame if we're running under it).
+    '''
+
+    def __init__(self, interval=SAMPLE_INTERVAL):
+        self.interval = interval
+        self.stacks = Counter()
+        self.labels = {}
+        self.root = None
+        self.skip = cProfile.Profile.runcall.__code__
+
+    @staticmethod
+    def available():
+        return hasattr(signal, 'setitimer') and hasattr(signal, 'SIGPROF')
+
+    def _sample(self, signum, frame):
+        stack = []
+        while frame is not None and frame is not self.root:
+            code = frame.f_code
+            if code is not self.skip:
+                if code not in self.labels:
+                    self.labels[code] = f'{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})'
+                stack.append(self.labels[code])
+            frame = frame.f_back
+        if stack:
+            self.stacks[';'.join(reversed(stack))] += 1
+
+    def start(self, root):
+        self.root = root
+        self.previous = signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+
+    def stop(self):
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, self.previous)
+
+    def write_collapsed(self, path):
+        with open(path, 'w') as f:
+            for stack, count in sorted(self.stacks.items()):
+                f.write(f'{stack} {count}\n')
+        return
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def top_functions(stats, n=TOP_N):
+    '''
+    The n functions with the most cumulative time as a list of dicts
+    (function, ncalls, tottime, cumtime) - plain data so it can cross processes.
+    The sampler's own signal handler is left out.
+    '''
+
+    rows = []
+    for (filename, line, name), (cc, nc, tt, ct, callers) in stats.stats.items():
+        if filename == __file__:
+            continue
+        where = f'{Path(filename).name}:{line}' if line else filename
+        rows.append({'function': f'{name} ({where})', 'ncalls': nc, 'tottime': tt, 'cumtime': ct})
+    rows.sort(key=lambda x: x['cumtime'], reverse=True)
+
+    return rows[:n]
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def profile_call(func, args, outbase):
+    '''
+    Call func(*args) under the profilers, writing <outbase>.pstats and (when
+    sampling is available) <outbase>.collapsed. Returns (return value, top
+    functions by cumulative time).
+    '''
+
+    outbase = Path(outbase)
+    outbase.parent.mkdir(parents=True, exist_ok=True)
+
+    sampler = StackSampler() if StackSampler.available() else None
+    profiler = cProfile.Profile()
+
+    if sampler is not None:
+        sampler.start(sys._getframe())
+    try:
+        out = profiler.runcall(func, *args)
+    finally:
+        if sampler is not None:
+            sampler.stop()
+
+    profiler.dump_stats(str(outbase.with_suffix('.pstats')))
+    if sampler is not None:
+        sampler.write_collapsed(outbase.with_suffix('.collapsed'))
+
+    stats = pstats.Stats(profiler)
+    return out, top_functions(stats)
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def print_top(day, part, top):
+    '''
+    Print the top functions by cumulative time for one task
+    '''
+
+    print(f'Day {day} part {part} - top {len(top)} by cumulative time')
+    print(f'  {"cumtime":>9}  {"tottime":>9}  {"ncalls":>9}  function')
+    for row in top:
+        print(f'  {row["cumtime"]:>9.3f}  {row["tottime"]:>9.3f}  {row["ncalls"]:>9}  {row["function"]}')
+
+    return
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+class PeakSnapshots:
+    '''
+    Keeps a tracemalloc snapshot from (close to) a task's peak memory use. Most
+    of what a task allocates is gone by the time it returns, so a snapshot at
+    the end says little. Instead a timer checks the traced memory every
+    "interval" seconds of CPU time and takes a new snapshot whenever it has
+    grown "growth" times past the last one.
+    '''
+
+    def __init__(self, interval=0.01, growth=1.1):
+        self.interval = interval
+        self.growth = growth
+        self.snapshot = None
+        self.size = 0
+
+    @staticmethod
+    def available():
+        return hasattr(signal, 'setitimer') and hasattr(signal, 'SIGVTALRM')
+
+    def check(self, *args):
+        current, _ = tracemalloc.get_traced_memory()
+        if self.snapshot is None or current > self.growth * self.size:
+            self.snapshot = tracemalloc.take_snapshot()
+            self.size = current
+
+    def start(self):
+        self.previous = signal.signal(signal.SIGVTALRM, self.check)
+        signal.setitimer(signal.ITIMER_VIRTUAL, self.interval, self.interval)
+
+    def stop(self):
+        signal.setitimer(signal.ITIMER_VIRTUAL, 0, 0)
+        signal.signal(signal.SIGVTALRM, self.previous)
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def trace_memory(func, args, n=TOP_N):
+    '''
+    Call func(*args) under tracemalloc. Returns (return value, memory report)
+    where the report holds the peak traced memory in bytes and the n source
+    lines holding the most memory around that peak, as plain data.
+    '''
+
+    snapshots = PeakSnapshots() if PeakSnapshots.available() else None
+
+    tracemalloc.start()
+    if snapshots is not None:
+        snapshots.start()
+    try:
+        out = func(*args)
+    finally:
+        if snapshots is not None:
+            snapshots.stop()
+        _, peak = tracemalloc.get_traced_memory()
+        final = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+    # Use the biggest snapshot we got, leaving out what tracemalloc and this
+    # module allocated along the way
+    snapshot = final
+    if snapshots is not None and snapshots.snapshot is not None:
+        if sum(x.size for x in snapshots.snapshot.traces) > sum(x.size for x in final.traces):
+            snapshot = snapshots.snapshot
+    snapshot = snapshot.filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+    ])
+
+    top = []
+    for stat in snapshot.statistics('lineno')[:n]:
+        frame = stat.traceback[0]
+        top.append({'line': f'{Path(frame.filename).name}:{frame.lineno}', 'size': stat.size, 'count': stat.count})
+
+    return out, {'peak': peak, 'top': top}
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def print_memory(day, part, report):
+    '''
+    Print the peak traced memory and top allocating lines for one task
+    '''
+
+    print(f'Day {day} part {part} - peak traced memory {report["peak"] / 2**20:.2f} MB, top allocating lines:')
+    print(f'  {"size (KB)":>10}  {"blocks":>8}  line')
+    for row in report['top']:
+        print(f'  {row["size"] / 2**10:>10.1f}  {row["count"]:>8}  {row["line"]}')
+
+    return
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def import_time(module_name, cwd):
+    '''
+    Import a module in a fresh interpreter under -X importtime. Returns the
+    module's cumulative import time in ms and its direct imports as a list of
+    (ms, name), slowest first.
+    '''
+
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module_name}'],
+        cwd=cwd, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise ImportError(proc.stderr.strip().splitlines()[-1])
+
+    # Lines look like "import time: <self us> | <cumulative us> | <indented name>",
+    # children come right before their parent and are indented two more spaces
+    entries = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip(' '))) // 2
+        entries.append((int(cumulative) / 1000, depth, name.strip()))
+
+    # Our module is the last top-level entry, its direct imports are just before it
+    total, depth, _ = entries[-1]
+    children = []
+    for ms, child_depth, name in reversed(entries[:-1]):
+        if child_depth <= depth:
+            break
+        if child_depth == depth + 1:
+            children.append((ms, name))
+    children.sort(reverse=True)
+
+    return total, children
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def print_import_times(times, budget=IMPORT_BUDGET_MS):
+    '''
+    Print each day's import time, flagging those over budget, along with the
+    imports that cost them the most
+    '''
+
+    print(f'{"Day":>3}  {"Import (ms)":>11}  Slowest imports')
+    print('-' * 57)
+    for day, (total, children) in sorted(times.items()):
+        flag = '!' if total > budget else ' '
+        slowest = ', '.join(f'{name} {ms:.1f}' for ms, name in children[:3])
+        print(f'{day:>3}  {total:>10.1f}{flag}  {slowest}')
+    print('-' * 57)
+    print(f'Budget: {budget} ms per day (! = over budget)')
+
+    return
@@ -0,0 +1,80 @@
+'''
+    What: Advent of Code 2023 - more than one way to solve a part
+    Who: Josh Geiser
+
+    Every day's task_N is its "reference" engine, the straightforward solution
+    everything else gets checked against. A day can register other engines for a
+    part (say "numpy" or "parallel") by decorating them with @engine, so a faster
+    algorithm can sit next to the original instead of replacing it. The runner
+    uses the fastest engine by default (once they've all been timed), and can
+    run them all and make sure they agree.
+'''
+
+import re
+
+# Name of the engine every part has - the day's own task_N
+REFERENCE = 'reference'
+
+# How the runner spots registered engines without importing the day
+ENGINE_RE = re.compile(r'''^@engine\((\d+),\s*['"](\w+)['"]''', re.M)
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def engine(part, name, read_input=None):
+    '''
+    Decorator registering a function as the engine called "name" for a part.
+    Engines take whatever the day's read_input() returns, just like task_N,
+    unless they bring their own "read_input" (e.g. loader.read_bytes for an
+    engine that works on the raw file).
+    '''
+
+    if name == REFERENCE:
+        raise ValueError(f'"{REFERENCE}" is always the day\'s own task_{part}')
+
+    def register(func):
+        func.engine = (part, name, read_input)
+        return func
+
+    return register
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def engines(module, part):
+    '''
+    Every engine a day module has for a part, as a dict of name to (function,
+    read_input function), starting with the reference and then in the order
+    they're defined
+    '''
+
+    found = {REFERENCE: (getattr(module, f'task_{part}'), module.read_input)}
+    for value in vars(module).values():
+        info = getattr(value, 'engine', None)
+        if callable(value) and isinstance(info, tuple) and info[0] == part:
+            _, name, read_input = info
+            found[name] = (value, read_input or module.read_input)
+
+    return found
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def scan(source):
+    '''
+    The engine names registered in a day's source, as a dict of part to list of
+    names (not counting the reference)
+    '''
+    found = {}
+    for part, name in ENGINE_RE.findall(source):
+        found.setdefault(int(part), []).append(name)
+    return found
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def fastest(names, medians):
+    '''
+    Pick which of a part's engines to run given the median times we have for
+    them (None where an engine has never been timed). Once every engine has been
+    timed that's just the fastest one. Until then we stick with the reference -
+    on the small real inputs a newer engine can easily lose to it (NumPy's
+    import alone takes longer than most days), so we don't guess.
+    '''
+
+    if names and all(medians.get(name) is not None for name in names):
+        return min(names, key=lambda name: medians[name])
+
+    return REFERENCE
@@ -0,0 +1,436 @@
+'''
+    What: Advent of Code 2023 - run every day's tasks across a process pool
+    Who: Josh Geiser
+
+    Usage (from the repository root):
+        python -m aoc.runner                    # every day, both parts
+        python -m aoc.runner --days 5 7 --parts 2
+        python -m aoc.runner --input temp.txt   # run against the sample inputs
+        python -m aoc.runner --days 22 --force  # ignore cached answers and recompute
+        python -m aoc.runner --days 16 --profile profiles
+        python -m aoc.runner --days 22 23 --memory
+        python -m aoc.runner --force --history  # fail if anything got slower
+        python -m aoc.runner --importtime       # cold-start import time per day
+        python -m aoc.runner --days 9 --parts 1 --stream < big_input.txt
+        python -m aoc.runner --days 12 --parts 2 --parallel 4
+        python -m aoc.runner --days 2 --engine reference
+        python -m aoc.runner --cross-check      # run every engine, fail if they disagree
+'''
+
+import argparse
+import importlib
+import io
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from aoc import cache, loader, registry
+from aoc.lazy import lazy_import
+
+# Only needed for some of the options - workers shouldn't pay to import these
+history = lazy_import('aoc.history')
+profiling = lazy_import('aoc.profiling')
+
+# Repository root - the DayNN folders are importable from here as namespace packages
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+# Parts that take far too long to run by default (Day 23 part 2 takes hours)
+SLOW_PARTS = {(23, 2)}
+
+# Days whose tasks work through their input one line at a time, so they can be
+# fed an iterator of lines (e.g. from stdin) rather than a list
+STREAMING_DAYS = {1, 2, 4, 6, 7, 9, 12}
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def find_days(root=ROOT):
+    '''
+    Find every DayNN/DayN.py module. Returns a dict mapping day number to a tuple
+    of (importable module name, dict of the parts that module defines a task for
+    to the names of their engines, reference first). Modules are only scanned
+    here, not imported, so the parent process never pays for the imports of the
+    days it hands off to workers.
+    '''
+
+    days = {}
+    for path in sorted(root.glob('Day[0-9][0-9]/Day*.py')):
+        day = int(path.parent.name[3:])
+        source = path.read_text()
+        engines = registry.scan(source)
+        parts = {}
+        for part in sorted({int(x) for x in re.findall(r'^def task_(\d+)\(', source, re.M)}):
+            parts[part] = [registry.REFERENCE] + engines.get(part, [])
+        days[day] = (f'{path.parent.name}.{path.stem}', parts)
+
+    return days
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def __peak_rss():
+    '''
+    Peak resident set size of the current process in MB (None if unavailable)
+    '''
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    # ru_maxrss is in bytes on macOS and kilobytes everywhere else
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss / 2**20 if sys.platform == 'darwin' else maxrss / 2**10
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def __normalize(answer):
+    '''
+    Turn an answer into something we can print, pickle and compare. Some days
+    return numpy integers, floats that are really integers, or None.
+    '''
+    if answer is None or isinstance(answer, (int, str)):
+        return answer
+    if isinstance(answer, float) and answer.is_integer():
+        return int(answer)
+    try:
+        return int(answer.__index__())
+    except (AttributeError, TypeError):
+        return repr(answer)
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def __get_task(module, part, engine=registry.REFERENCE, parallel=None):
+    '''
+    The (task, read_input) functions for one of a part's engines. The parallel
+    engines also get told how many processes to use, if we were given that.
+    '''
+    task, read_input = registry.engines(module, part)[engine]
+    if engine == 'parallel' and parallel:
+        return (lambda inputs: task(inputs, parallel)), read_input
+    return task, read_input
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def run_part(module_name, part, infile, engine=registry.REFERENCE, profile_dir=None, parallel=None, memory=False):
+    '''
+    Worker for a single (day, part) job - import the day, read its input and time
+    the task with the given engine. Anything the task prints is swallowed so it
+    doesn't garble the table. With a "profile_dir" the task runs under the
+    profilers, which write their output there, and the result also carries the
+    task's top functions. With "memory" it runs under tracemalloc instead, and
+    the result carries its peak traced memory and top allocating lines. Either
+    way reading and parsing the input is watched too, since that's part of
+    what a task costs.
+    '''
+
+    module = importlib.import_module(module_name)
+    task, read_input = __get_task(module, part, engine, parallel)
+
+    def read_and_solve():
+        return task(read_input(infile))
+
+    top = None
+    report = None
+    with redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        if profile_dir is not None:
+            outbase = Path(profile_dir) / f'{module_name.split(".")[0]}_part{part}'
+            answer, top = profiling.profile_call(read_and_solve, (), outbase)
+        elif memory:
+            answer, report = profiling.trace_memory(read_and_solve, ())
+        else:
+            answer = read_and_solve()
+        elapsed = time.perf_counter() - start
+
+    result = {'answer': __normalize(answer), 'time': elapsed, 'rss': __peak_rss(), 'engine': engine}
+    if top is not None:
+        result['profile'] = top
+    if report is not None:
+        result['memory'] = report
+
+    return result
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def run_stream(module_name, part, stream, engine=registry.REFERENCE, parallel=None):
+    '''
+    Run a single part in this process, feeding it the lines of an open text
+    stream (e.g. stdin) one at a time instead of reading a whole file first.
+    Engines that read the input file their own way can't be streamed (main()
+    turns those away before we get here).
+    '''
+
+    module = importlib.import_module(module_name)
+    task, _ = __get_task(module, part, engine, parallel)
+
+    with redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        answer = task(loader.iter_lines(stream))
+        elapsed = time.perf_counter() - start
+
+    return {'answer': __normalize(answer), 'time': elapsed, 'rss': __peak_rss(), 'engine': engine}
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def get_jobs(days, selected_days=None, selected_parts=None, include_slow=False):
+    '''
+    Build the list of (day, part, module_name) jobs to run
+    '''
+
+    jobs = []
+    for day, (module_name, parts) in days.items():
+        if selected_days and day not in selected_days:
+            continue
+        for part in parts:
+            if selected_parts and part not in selected_parts:
+                continue
+            if (day, part) in SLOW_PARTS and not include_slow:
+                continue
+            jobs.append((day, part, module_name))
+
+    return jobs
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def choose_engines(jobs, days, input_name='input.txt', requested=None, window=10):
+    '''
+    Pick the engine each job runs with - "requested" wherever the day has it,
+    otherwise the fastest according to the timing history (see
+    registry.fastest). Returns a dict of (day, part) to engine name.
+    '''
+
+    chosen = {}
+    db = None
+    for day, part, _ in jobs:
+        names = days[day][1][part]
+        if requested in names or len(names) == 1:
+            chosen[(day, part)] = requested if requested in names else names[0]
+            continue
+
+        # Only open the history when there's actually a choice to make
+        medians = {}
+        if db is None and history.HISTORY_DB.exists():
+            db = history.connect()
+        if db is not None:
+            medians = {name: history.rolling_median(db, day, part, input_name, window, name) for name in names}
+        chosen[(day, part)] = registry.fastest(names, medians)
+
+    if db is not None:
+        db.close()
+
+    return chosen
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def run_jobs(jobs, input_name='input.txt', workers=None, force=False, profile_dir=None, parallel=None, memory=False, engines=None):
+    '''
+    Run each job in its own worker process. Every worker only ever runs one job
+    (max_tasks_per_child=1) so that the peak RSS we report belongs to that job.
+    Later days tend to be the slow ones, so submit those first to keep the pool
+    busy until the end. Answers we've already computed for the same input and
+    the same day source come straight from the cache unless "force" is set
+    (profiling and memory tracing always recompute, since the point is to watch
+    the work happen). "engines" maps (day, part) to the engine to run, which is
+    the reference wherever it's missing. Every engine gives the same answer, so
+    they all share the cache.
+    '''
+
+    engines = engines or {}
+
+    results = {}
+    keys = {}
+    with ProcessPoolExecutor(max_workers=workers, max_tasks_per_child=1) as pool:
+        futures = {}
+        for day, part, module_name in sorted(jobs, reverse=True):
+            infile = ROOT / module_name.split('.')[0] / input_name
+            source = ROOT / (module_name.replace('.', '/') + '.py')
+            keys[(day, part)] = cache.cache_key(day, part, infile, source)
+
+            # Skip the work entirely if we already know the answer
+            hit = None if (force or profile_dir or memory) else cache.load(keys[(day, part)])
+            if hit is not None:
+                results[(day, part)] = {'answer': hit['answer'], 'time': None, 'rss': None, 'cached': True}
+                continue
+
+            futures[(day, part)] = pool.submit(run_part, module_name, part, infile, engines.get((day, part), registry.REFERENCE),
+                                                 profile_dir, parallel, memory)
+
+        for key, future in futures.items():
+            try:
+                results[key] = future.result()
+            except Exception as e:
+                results[key] = {'answer': f'ERROR: {e!r}', 'time': None, 'rss': None, 'error': True}
+            else:
+                cache.store(keys[key], results[key])
+
+    return results
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def cross_check(jobs, days, input_name='input.txt', workers=None, parallel=None):
+    '''
+    Run every engine of every job, each in its own worker like run_jobs() (and
+    never from the cache). Returns a dict of (day, part) to a dict of engine
+    name to result.
+    '''
+
+    checked = {}
+    with ProcessPoolExecutor(max_workers=workers, max_tasks_per_child=1) as pool:
+        futures = {}
+        for day, part, module_name in sorted(jobs, reverse=True):
+            infile = ROOT / module_name.split('.')[0] / input_name
+            for name in days[day][1][part]:
+                futures[(day, part, name)] = pool.submit(run_part, module_name, part, infile, name, None, parallel)
+
+        for (day, part, name), future in futures.items():
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {'answer': f'ERROR: {e!r}', 'time': None, 'rss': None, 'engine': name, 'error': True}
+            checked.setdefault((day, part), {})[name] = result
+
+    return checked
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def disagreements(checked):
+    '''
+    The (day, part)s whose engines didn't all come up with the same answer
+    '''
+    return [key for key, runs in sorted(checked.items()) if len({repr(r['answer']) for r in runs.values()}) > 1]
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def print_table(results, wall_time):
+    '''
+    Print a per-part table of engines, answers, wall-clock times and peak RSS.
+    "results" maps (day, part) to a result, or to a dict of engine name to
+    result for a cross-check.
+    '''
+
+    rows = []
+    for (day, part), result in sorted(results.items()):
+        rows.extend((day, part, r) for r in (result.values() if 'answer' not in result else [result]))
+
+    print(f'{"Day":>3}  {"Part":>4}  {"Engine":>10}  {"Answer":>20}  {"Time (s)":>9}  {"Peak RSS (MB)":>13}')
+    print('-' * 69)
+    for day, part, result in rows:
+        elapsed = '-' if result['time'] is None else f'{result["time"]:.3f}'
+        if result.get('cached'):
+            elapsed = 'cached'
+        rss = '-' if result['rss'] is None else f'{result["rss"]:.1f}'
+        engine = result.get('engine', '-')
+        print(f'{day:>3}  {part:>4}  {engine:>10}  {str(result["answer"]):>20}  {elapsed:>9}  {rss:>13}')
+    print('-' * 69)
+
+    serial_time = sum(r['time'] for _, _, r in rows if r['time'] is not None)
+    print(f'Total task time: {serial_time:.3f} s, wall-clock: {wall_time:.3f} s')
+
+    return
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Run Advent of Code 2023 solutions')
+    parser.add_argument('--days', type=int, nargs='+', help='days to run (default: all)')
+    parser.add_argument('--parts', type=int, nargs='+', help='parts to run (default: all)')
+    parser.add_argument('--input', default='input.txt', help='input file name inside each DayNN folder')
+    parser.add_argument('--workers', type=int, default=None, help='number of worker processes')
+    parser.add_argument('--all', action='store_true', help=f'also run the slow parts {sorted(SLOW_PARTS)}')
+    parser.add_argument('--force', action='store_true', help='recompute answers even if they are cached')
+    parser.add_argument('--profile', metavar='DIR', help='profile each task, writing .pstats and .collapsed files to DIR')
+    parser.add_argument('--memory', action='store_true', help='trace each task with tracemalloc, reporting peak memory and top allocating lines')
+    parser.add_argument('--history', action='store_true', help='compare times against (and add them to) the timing history')
+    parser.add_argument('--threshold', type=float, default=1.5, help='with --history, fail if a part is this many times slower than its rolling median')
+    parser.add_argument('--window', type=int, default=10, help='with --history, number of previous runs in the rolling median')
+    parser.add_argument('--importtime', action='store_true', help='report how long each day takes to import instead of running it')
+    parser.add_argument('--parallel', type=int, metavar='N', help='use the parallel engines (where days have one) with N processes each')
+    parser.add_argument('--engine', help='use this engine wherever a day has it (default: the fastest one)')
+    parser.add_argument('--cross-check', action='store_true', help='run every engine of each part and fail if their answers differ')
+    parser.add_argument('--stream', action='store_true', help=f'stream the input of a single day/part from stdin (days {sorted(STREAMING_DAYS)})')
+    return parser.parse_args(argv)
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+def main(argv=None):
+
+    args = parse_args(argv)
+
+    # Figure out what we're running
+    days = find_days()
+    jobs = get_jobs(days, args.days, args.parts, include_slow=args.all)
+
+    # --parallel is shorthand for the parallel engines
+    requested = args.engine or ('parallel' if args.parallel else None)
+    if requested and not any(requested in days[day][1][part] for day, part, _ in jobs):
+        sys.exit(f'None of the selected days has an engine called {requested!r}')
+
+    # Streaming a single day/part from stdin doesn't need the pool (or the cache)
+    if args.stream:
+        if len(jobs) != 1 or jobs[0][0] not in STREAMING_DAYS:
+            sys.exit(f'--stream needs exactly one day and part, from days {sorted(STREAMING_DAYS)}')
+        day, part, module_name = jobs[0]
+        engine = requested if requested in days[day][1][part] else registry.REFERENCE
+        module = importlib.import_module(module_name)
+        if registry.engines(module, part)[engine][1] is not module.read_input:
+            sys.exit(f'The {engine} engine reads its own input, so it can\'t be streamed')
+        start = time.perf_counter()
+        result = run_stream(module_name, part, sys.stdin, engine, args.parallel)
+        print_table({(day, part): result}, time.perf_counter() - start)
+        return 0
+
+    # Just measure the cold-start imports if that's all that was asked for
+    if args.importtime:
+        times = {day: profiling.import_time(module_name, ROOT) for day, _, module_name in jobs}
+        profiling.print_import_times(times)
+        return 0
+
+    # Run every engine and make sure they all agree (recording their times, which
+    # is how the default engine choice knows which is fastest)
+    if args.cross_check:
+        start = time.perf_counter()
+        checked = cross_check(jobs, days, input_name=args.input, workers=args.workers, parallel=args.parallel)
+        print_table(checked, time.perf_counter() - start)
+
+        if args.history:
+            db = history.connect()
+            for name in {name for runs in checked.values() for name in runs}:
+                history.record(db, {key: runs[name] for key, runs in checked.items() if name in runs}, args.input)
+            db.close()
+
+        bad = disagreements(checked)
+        print()
+        if bad:
+            print('Engines disagree on ' + ', '.join(f'Day {day} part {part}' for day, part in bad))
+            return 1
+        print('All engines agree')
+        return 0
+
+    # Run everything and print our results
+    start = time.perf_counter()
+    if args.profile and args.memory:
+        sys.exit('--profile and --memory each slow the tasks down, use one at a time')
+    profile_dir = None if args.profile is None else Path(args.profile).resolve()
+    engines = choose_engines(jobs, days, args.input, requested, args.window)
+
+    # Every engine shares the cache, so asking for one by name means recomputing -
+    # otherwise we'd print a cached answer instead of timing that engine
+    results = run_jobs(jobs, input_name=args.input, workers=args.workers, force=args.force or requested is not None,
+                       profile_dir=profile_dir, parallel=args.parallel, memory=args.memory, engines=engines)
+    print_table(results, time.perf_counter() - start)
+
+    # Where did the time go?
+    for (day, part), result in sorted(results.items()):
+        if 'profile' in result:
+            print()
+            profiling.print_top(day, part, result['profile'])
+        if 'memory' in result:
+            print()
+            profiling.print_memory(day, part, result['memory'])
+
+    # Check for slowdowns against our previous runs, then add this one to the history
+    if args.history:
+        db = history.connect()
+        regressions = history.find_regressions(db, results, args.input, args.window, args.threshold)
+        history.record(db, results, args.input)
+        db.close()
+
+        print()
+        history.print_regressions(regressions, args.threshold)
+        if regressions:
+            return 1
+
+    return 0
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+if __name__ == '__main__':
+    sys.exit(main())